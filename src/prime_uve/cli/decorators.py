@@ -9,40 +9,47 @@ import click
 
 from prime_uve.cli.output import error, info
 
-
-def common_options(func: Callable) -> Callable:
-    """
-    Decorator to add common CLI options to commands.
-
-    Adds:
-        --verbose: Enable verbose output
-        --yes: Skip confirmation prompts
-        --dry-run: Show what would be done without doing it
-        --json: Output results as JSON
-    """
-    func = click.option(
+# Built once at import and reused for every command. Applied bottom-up, so
+# --verbose ends up first in --help, as before.
+_COMMON_OPTIONS = (
+    click.option(
         "--json",
         "json_output",
         is_flag=True,
         help="Output results as JSON",
-    )(func)
-    func = click.option(
+    ),
+    click.option(
         "--dry-run",
         is_flag=True,
         help="Show what would be done without doing it",
-    )(func)
-    func = click.option(
+    ),
+    click.option(
         "--yes",
         "-y",
         is_flag=True,
         help="Skip confirmation prompts",
-    )(func)
-    func = click.option(
+    ),
+    click.option(
         "--verbose",
         "-v",
         is_flag=True,
         help="Enable verbose output",
-    )(func)
+    ),
+)
+
+
+def common_options(func: Callable) -> Callable:
+    """
+    Decorator to add common CLI options to commands.
+
+    Adds:
+        --verbose: Enable verbose output
+        --yes: Skip confirmation prompts
+        --dry-run: Show what would be done without doing it
+        --json: Output results as JSON
+    """
+    for option in _COMMON_OPTIONS:
+        func = option(func)
     return func
 
 
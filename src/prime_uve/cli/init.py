@@ -71,11 +71,16 @@ def init_command(
             )
         # If .env.uve exists but UV_PROJECT_ENVIRONMENT is not set, we can initialize
 
-    # 4. Confirm force if overwriting
+    # 4. Generate venv path (always uses ${HOME})
+    # Note: venv_dir parameter is currently not supported by generate_venv_path
+    # For now, ignore the --venv-dir option
+    venv_path = generate_venv_path(project_root)
+
+    # 5. Confirm force if overwriting
     if force and env_file.exists():
         existing_vars = read_env_file(env_file)
         old_venv = existing_vars.get("UV_PROJECT_ENVIRONMENT", "(not set)")
-        new_venv = generate_venv_path(project_root)
+        new_venv = venv_path
 
         if old_venv != new_venv and not yes:
             other_vars_count = len(
@@ -98,10 +103,7 @@ def init_command(
             ):
                 raise click.Abort()
 
-    # 5. Generate venv path (always uses ${HOME})
-    # Note: venv_dir parameter is currently not supported by generate_venv_path
-    # For now, ignore the --venv-dir option
-    venv_path = generate_venv_path(project_root)
+    # Expanded form and hash for output and the cache entry
     venv_path_expanded = expand_path_variables(venv_path)
     path_hash = generate_hash(project_root)
 
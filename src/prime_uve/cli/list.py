@@ -8,14 +8,15 @@ from typing import Optional
 import click
 
 from prime_uve.cli.output import echo, error, info, print_json
+from prime_uve.cli.venvs import get_disk_usage, scan_venv_directory
 from prime_uve.core.cache import Cache
 from prime_uve.core.env_file import read_env_file
-from prime_uve.core.paths import expand_path_variables, get_venv_base_dir
+from prime_uve.core.paths import expand_path_variables, get_home_dir
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
-    """Result of validating a cached project mapping."""
+    """Result of validating a cached project mapping (one per cache entry)."""
 
     project_name: str
     project_path: Path
@@ -28,7 +29,12 @@ class ValidationResult:
     disk_usage_bytes: int
 
 
-def validate_project_mapping(project_path: str, cache_entry: dict) -> ValidationResult:
+def validate_project_mapping(
+    project_path: str,
+    cache_entry: dict,
+    home: str | None = None,
+    measure_disk: bool = True,
+) -> ValidationResult:
     """
     Validate a project mapping.
 
@@ -39,30 +45,32 @@ def validate_project_mapping(project_path: str, cache_entry: dict) -> Validation
     Args:
         project_path: Absolute path to project directory
         cache_entry: Cache entry with venv_path, project_name, etc.
+        home: Pre-resolved home directory for ${HOME} expansion (optional)
+        measure_disk: Whether to walk the venv for its disk usage
 
     Returns:
         ValidationResult with validation status
     """
     project_path_obj = Path(project_path)
     venv_path = cache_entry["venv_path"]
-    venv_path_expanded = expand_path_variables(venv_path)
+    venv_path_expanded = expand_path_variables(venv_path, home)
 
     # Single check: does .env.uve match cache?
     env_venv_path = None
     is_valid = False
 
+    # read_env_file raises for a missing file, so no separate exists() stat
     env_file = project_path_obj / ".env.uve"
     try:
-        if env_file.exists():
-            env_vars = read_env_file(env_file)
-            env_venv_path = env_vars.get("UV_PROJECT_ENVIRONMENT")
-            is_valid = env_venv_path == venv_path
+        env_vars = read_env_file(env_file)
+        env_venv_path = env_vars.get("UV_PROJECT_ENVIRONMENT")
+        is_valid = env_venv_path == venv_path
     except Exception:
-        pass  # Any error → not valid
+        pass  # Any error (including missing file) → not valid
 
-    # Get disk usage if venv exists
+    # Get disk usage (0 if venv is missing)
     disk_usage = 0
-    if venv_path_expanded.exists():
+    if measure_disk:
         try:
             disk_usage = get_disk_usage(venv_path_expanded)
         except Exception:
@@ -81,39 +89,28 @@ def validate_project_mapping(project_path: str, cache_entry: dict) -> Validation
     )
 
 
-def scan_venv_directory() -> list[Path]:
-    """
-    Scan venv base directory for all venv directories.
-
-    Returns:
-        List of venv directory paths
-    """
-    venv_base = get_venv_base_dir()
-    if not venv_base.exists():
-        return []
-
-    try:
-        return [d for d in venv_base.iterdir() if d.is_dir()]
-    except (OSError, PermissionError):
-        return []
-
-
-def find_untracked_venvs(cache_entries: dict) -> list[dict]:
+def find_untracked_venvs(
+    cache_entries: dict, home: str | None = None, measure_disk: bool = True
+) -> list[dict]:
     """
     Find venvs on disk that aren't in cache (treat as orphans).
 
     Args:
         cache_entries: Dictionary of cache entries (project_path -> entry)
+        home: Pre-resolved home directory for ${HOME} expansion (optional)
+        measure_disk: Whether to walk each venv for its disk usage
 
     Returns:
         List of untracked venv dictionaries
     """
     all_venvs = scan_venv_directory()
     tracked_venvs = set()
+    if home is None:
+        home = get_home_dir()
 
     # Build set of tracked venv paths
     for cache_entry in cache_entries.values():
-        venv_path_expanded = expand_path_variables(cache_entry["venv_path"])
+        venv_path_expanded = expand_path_variables(cache_entry["venv_path"], home)
         tracked_venvs.add(venv_path_expanded)
 
     # Find untracked venvs
@@ -133,36 +130,15 @@ def find_untracked_venvs(cache_entries: dict) -> list[dict]:
                     "created_at": None,  # No creation time for untracked
                     "is_valid": False,  # Treat as orphan
                     "env_venv_path": None,
-                    "disk_usage_bytes": get_disk_usage(venv_dir),
+                    "disk_usage_bytes": (
+                        get_disk_usage(venv_dir) if measure_disk else 0
+                    ),
                 }
             )
 
     return untracked
 
 
-def get_disk_usage(path: Path) -> int:
-    """
-    Calculate total disk usage of a directory in bytes.
-
-    Args:
-        path: Directory path
-
-    Returns:
-        Total size in bytes
-    """
-    total = 0
-    try:
-        for item in path.rglob("*"):
-            if item.is_file():
-                try:
-                    total += item.stat().st_size
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
-
-
 def format_bytes(size: int) -> str:
     """
     Format bytes to human-readable string.
@@ -204,8 +180,10 @@ def truncate_path(path: str, max_length: int) -> str:
     if len(path) <= max_length:
         return path
 
-    # Try to keep the end (most specific part)
-    return "..." + path[-(max_length - 3) :]
+    # Keep the end (most specific part). Slice from an explicit start index:
+    # path[-0:] would return the whole string when max_length is 3.
+    keep = max(max_length - 3, 0)
+    return "..." + path[len(path) - keep :]
 
 
 def output_table(results: list, stats: dict, verbose: bool) -> None:
@@ -217,7 +195,8 @@ def output_table(results: list, stats: dict, verbose: bool) -> None:
         stats: Statistics dictionary
         verbose: Whether to show verbose output
     """
-    echo("Managed Virtual Environments\n")
+    # Collect the whole table and write it once instead of echoing per row
+    lines = ["Managed Virtual Environments\n"]
 
     if verbose:
         # Wide format with disk usage
@@ -271,29 +250,29 @@ def output_table(results: list, stats: dict, verbose: bool) -> None:
 
             color = "green" if is_valid else "red"
             # Show project name, status, size on first line
-            formatted_line = f"{project_name:<20} "
-            echo(formatted_line, nl=False)
-            click.secho(f"{status_display:<15}", fg=color, nl=False)
-            echo(f" {size}")  # Size on same line
+            status_styled = click.style(f"{status_display:<15}", fg=color)
+            lines.append(f"{project_name:<20} {status_styled} {size}")
 
             # Extra details in verbose mode
             if project_path:
-                echo(f"  Project: {project_path}")
-            echo(f"  Venv:    {venv_path_expanded}")
+                lines.append(f"  Project: {project_path}")
+            lines.append(f"  Venv:    {venv_path_expanded}")
             if hash_val:
-                echo(f"  Hash:    {hash_val}")
+                lines.append(f"  Hash:    {hash_val}")
             if created_at:
-                echo(f"  Created: {created_at}")
+                lines.append(f"  Created: {created_at}")
 
             if not is_valid and venv_path:
-                echo(f"  Cache:     {venv_path}")
-                echo(f"  .env.uve:  {env_venv_path or 'Not found (or path mismatch)'}")
-            echo("")
+                lines.append(f"  Cache:     {venv_path}")
+                lines.append(
+                    f"  .env.uve:  {env_venv_path or 'Not found (or path mismatch)'}"
+                )
+            lines.append("")
     else:
         # Compact format - venv path at end so it can be full-length/clickable
         header = f"{'PROJECT':<20} {'STATUS':<15} {'VENV PATH'}"
-        echo(header)
-        echo("-" * 80)  # Fixed width separator
+        lines.append(header)
+        lines.append("-" * 80)  # Fixed width separator
 
         for result in results:
             # Handle both ValidationResult and untracked venv dicts
@@ -318,19 +297,19 @@ def output_table(results: list, stats: dict, verbose: bool) -> None:
 
             color = "green" if is_valid else "red"
             # Don't truncate venv path - show full path so user can click it
-            formatted_line = f"{project_name:<20} "
-            echo(formatted_line, nl=False)
-            click.secho(f"{status_display:<15}", fg=color, nl=False)
-            echo(f" {venv_path_expanded}")
+            status_styled = click.style(f"{status_display:<15}", fg=color)
+            lines.append(f"{project_name:<20} {status_styled} {venv_path_expanded}")
 
     # Summary
-    echo(
+    lines.append(
         f"\nSummary: {stats['total']} total, {stats['valid']} valid, {stats['orphaned']} orphaned"
     )
 
     if verbose and stats["total_disk_usage"] > 0:
         total_size = format_bytes(stats["total_disk_usage"])
-        echo(f"Total disk usage: {total_size}")
+        lines.append(f"Total disk usage: {total_size}")
+
+    echo("\n".join(lines))
 
 
 def output_json_format(results: list, stats: dict) -> None:
@@ -414,14 +393,18 @@ def list_command(
         error(f"Failed to load cache: {e}")
         sys.exit(1)
 
-    # 2. Validate all cached mappings
+    # 2. Validate all cached mappings (resolve ${HOME} once, not per row).
+    # Sizes are only shown in verbose and JSON output, so skip the walks
+    # for the plain table.
+    home = get_home_dir()
+    measure_disk = verbose or json_output
     results = []
     for project_path, cache_entry in mappings.items():
-        result = validate_project_mapping(project_path, cache_entry)
+        result = validate_project_mapping(project_path, cache_entry, home, measure_disk)
         results.append(result)
 
     # 3. Find and add untracked venvs as orphans
-    untracked_venvs = find_untracked_venvs(mappings)
+    untracked_venvs = find_untracked_venvs(mappings, home, measure_disk)
     results.extend(untracked_venvs)
 
     # If no venvs at all (cached or untracked)
@@ -1,40 +1,47 @@
 """Prune command implementation for prime-uve."""
 
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import click
 
 from prime_uve.cli.output import echo, error, info, success, warning, print_json
+from prime_uve.cli.venvs import get_disk_usage, scan_venv_directory
 from prime_uve.core.cache import Cache
-from prime_uve.core.env_file import find_env_file, read_env_file, write_env_file
-from prime_uve.core.paths import expand_path_variables, get_venv_base_dir
+from prime_uve.core.env_file import find_env_file, read_env_file
+from prime_uve.core.paths import (
+    expand_path_variables,
+    get_home_dir,
+    get_venv_base_dir,
+)
 from prime_uve.core.project import find_project_root
 
 
-def get_disk_usage(path: Path) -> int:
+def measure_venvs(paths: list[Path]) -> list[int]:
     """
-    Calculate total disk usage of a directory in bytes.
+    Calculate disk usage of several venvs concurrently.
+
+    Each venv is walked sequentially on its own worker thread, so the pool
+    does not nest inside get_disk_usage's per-subdirectory fan-out.
 
     Args:
-        path: Directory path
+        paths: Venv directory paths (missing ones measure as 0)
 
     Returns:
-        Total size in bytes
+        Sizes in bytes, in the same order as paths
     """
-    total = 0
-    try:
-        for item in path.rglob("*"):
-            if item.is_file():
-                try:
-                    total += item.stat().st_size
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
+    if len(paths) < 2:
+        return [get_disk_usage(path) for path in paths]
+
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(lambda path: get_disk_usage(path, workers=1), paths))
+
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
 def format_bytes(size: int) -> str:
@@ -47,38 +54,13 @@ def format_bytes(size: int) -> str:
     Returns:
         Formatted string (e.g., "125 MB", "1.5 GB")
     """
-    if size == 0:
-        return "0 B"
+    if size < 1024:
+        return f"{size} B"
 
-    units = ["B", "KB", "MB", "GB", "TB"]
-    unit_index = 0
-
-    size_float = float(size)
-    while size_float >= 1024 and unit_index < len(units) - 1:
-        size_float /= 1024
-        unit_index += 1
-
-    if unit_index == 0:
-        return f"{int(size_float)} {units[unit_index]}"
-    else:
-        return f"{size_float:.1f} {units[unit_index]}"
-
-
-def scan_venv_directory() -> list[Path]:
-    """
-    Scan venv base directory for all venv directories.
-
-    Returns:
-        List of venv directory paths
-    """
-    venv_base = get_venv_base_dir()
-    if not venv_base.exists():
-        return []
-
-    try:
-        return [d for d in venv_base.iterdir() if d.is_dir()]
-    except (OSError, PermissionError):
-        return []
+    # Each unit is 2**10 of the previous one, so the unit index is the
+    # number of whole 10-bit groups above the lowest bit
+    unit_index = min((size.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{size / (1 << (unit_index * 10)):.1f} {_BYTE_UNITS[unit_index]}"
 
 
 def find_untracked_venvs(cache_entries: dict) -> list[dict]:
@@ -92,33 +74,43 @@ def find_untracked_venvs(cache_entries: dict) -> list[dict]:
         List of untracked venv dictionaries
     """
     all_venvs = scan_venv_directory()
-    tracked_venvs = set()
 
     # Build set of tracked venv paths
-    for cache_entry in cache_entries.values():
-        venv_path_expanded = expand_path_variables(cache_entry["venv_path"])
-        tracked_venvs.add(venv_path_expanded)
+    home = get_home_dir()
+    tracked_venvs = {
+        expand_path_variables(cache_entry["venv_path"], home)
+        for cache_entry in cache_entries.values()
+    }
+
+    # Find untracked venvs and measure them in parallel
+    untracked_dirs = sorted(
+        venv_dir for venv_dir in all_venvs if venv_dir not in tracked_venvs
+    )
+    sizes = measure_venvs(untracked_dirs)
 
-    # Find untracked venvs
     untracked = []
-    for venv_dir in all_venvs:
-        if venv_dir not in tracked_venvs:
-            # Extract project name from directory name (e.g., "test-project_abc123" -> "test-project")
-            dir_name = venv_dir.name
-            project_name = dir_name.rsplit("_", 1)[0] if "_" in dir_name else dir_name
-
-            untracked.append(
-                {
-                    "project_name": f"<unknown: {project_name}>",
-                    "venv_path": None,  # No variable form for untracked
-                    "venv_path_expanded": venv_dir,
-                    "size": get_disk_usage(venv_dir),
-                }
-            )
+    for venv_dir, size in zip(untracked_dirs, sizes):
+        # Extract project name from directory name (e.g., "test-project_abc123" -> "test-project")
+        dir_name = venv_dir.name
+        project_name = dir_name.rsplit("_", 1)[0] if "_" in dir_name else dir_name
+
+        untracked.append(
+            {
+                "project_name": f"<unknown: {project_name}>",
+                "venv_path": None,  # No variable form for untracked
+                "venv_path_expanded": venv_dir,
+                "size": size,
+            }
+        )
 
     return untracked
 
 
+def _venv_path_key(item: tuple[str, dict]) -> str:
+    """Sort key for (project_path, cache_entry) pairs: the cached venv path."""
+    return item[1].get("venv_path", "")
+
+
 def is_orphaned(project_path: str, cache_entry: dict) -> bool:
     """
     Check if a cached venv is orphaned.
@@ -137,12 +129,12 @@ def is_orphaned(project_path: str, cache_entry: dict) -> bool:
     project_path_obj = Path(project_path)
     cached_venv_path = cache_entry["venv_path"]
 
+    # read_env_file raises for a missing file, so no separate exists() stat
     env_file = project_path_obj / ".env.uve"
     try:
-        if env_file.exists():
-            env_vars = read_env_file(env_file)
-            env_venv_path = env_vars.get("UV_PROJECT_ENVIRONMENT")
-            return env_venv_path != cached_venv_path
+        env_vars = read_env_file(env_file)
+        env_venv_path = env_vars.get("UV_PROJECT_ENVIRONMENT")
+        return env_venv_path != cached_venv_path
     except Exception:
         pass
 
@@ -162,19 +154,18 @@ def remove_venv_directory(venv_path: str, dry_run: bool) -> tuple[bool, Optional
         Tuple of (success, error_message)
     """
     try:
-        # If path contains ${HOME}, expand it; otherwise treat as literal path
-        if "${HOME}" in str(venv_path):
-            venv_path_expanded = expand_path_variables(venv_path)
-        else:
-            venv_path_expanded = Path(venv_path)
-
-        if not venv_path_expanded.exists():
-            return True, None  # Already gone
+        # Expansion is a no-op for literal paths (e.g. untracked venvs)
+        venv_path_expanded = expand_path_variables(str(venv_path))
 
         if dry_run:
             return True, None
 
-        shutil.rmtree(venv_path_expanded)
+        # rmtree already removes entries relative to directory fds
+        # (openat/unlinkat) where the platform supports it
+        try:
+            shutil.rmtree(venv_path_expanded)
+        except FileNotFoundError:
+            pass  # Already gone
         return True, None
 
     except Exception as e:
@@ -213,22 +204,27 @@ def prune_all(
             info("No managed venvs found.")
         return
 
-    # Calculate total size
-    total_size = 0
-    venvs_to_remove = []
+    # Order by venv path so removals walk sibling directories in sequence
+    entries = sorted(mappings.items(), key=_venv_path_key)
 
-    for project_path, cache_entry in mappings.items():
-        venv_path = cache_entry["venv_path"]
-        venv_path_expanded = expand_path_variables(venv_path)
-        size = 0
-        if venv_path_expanded.exists():
-            size = get_disk_usage(venv_path_expanded)
-        total_size += size
+    # Expand all paths first, then measure the venvs in parallel
+    home = get_home_dir()
+    expanded = [
+        expand_path_variables(cache_entry["venv_path"], home)
+        for _, cache_entry in entries
+    ]
+    sizes = measure_venvs(expanded)
+    total_size = sum(sizes)
+
+    venvs_to_remove = []
+    for (project_path, cache_entry), venv_path_expanded, size in zip(
+        entries, expanded, sizes
+    ):
         venvs_to_remove.append(
             {
                 "project_name": cache_entry["project_name"],
                 "project_path": project_path,
-                "venv_path": venv_path,
+                "venv_path": cache_entry["venv_path"],
                 "venv_path_expanded": str(venv_path_expanded),
                 "size": size,
             }
@@ -343,28 +339,34 @@ def prune_orphan(
         error(f"Failed to load cache: {e}")
         sys.exit(1)
 
-    # Find cached orphaned venvs
+    # Find cached orphaned venvs, then measure them in parallel
+    candidates = [
+        (project_path, cache_entry)
+        for project_path, cache_entry in sorted(mappings.items(), key=_venv_path_key)
+        if is_orphaned(project_path, cache_entry)
+    ]
+    home = get_home_dir()
+    expanded = [
+        expand_path_variables(cache_entry["venv_path"], home)
+        for _, cache_entry in candidates
+    ]
+    sizes = measure_venvs(expanded)
+    total_size = sum(sizes)
+
     orphaned_venvs = []
-    total_size = 0
-
-    for project_path, cache_entry in mappings.items():
-        if is_orphaned(project_path, cache_entry):
-            venv_path = cache_entry["venv_path"]
-            venv_path_expanded = expand_path_variables(venv_path)
-            size = 0
-            if venv_path_expanded.exists():
-                size = get_disk_usage(venv_path_expanded)
-            total_size += size
-            orphaned_venvs.append(
-                {
-                    "project_name": cache_entry["project_name"],
-                    "project_path": project_path,
-                    "venv_path": venv_path,
-                    "venv_path_expanded": str(venv_path_expanded),
-                    "size": size,
-                    "is_tracked": True,  # Mark as from cache
-                }
-            )
+    for (project_path, cache_entry), venv_path_expanded, size in zip(
+        candidates, expanded, sizes
+    ):
+        orphaned_venvs.append(
+            {
+                "project_name": cache_entry["project_name"],
+                "project_path": project_path,
+                "venv_path": cache_entry["venv_path"],
+                "venv_path_expanded": str(venv_path_expanded),
+                "size": size,
+                "is_tracked": True,  # Mark as from cache
+            }
+        )
 
     # Find untracked venvs (also treat as orphans)
     untracked_venvs = find_untracked_venvs(mappings)
@@ -411,6 +413,7 @@ def prune_orphan(
     # Remove orphaned venvs
     removed = []
     failed = []
+    cache_removals = []
 
     for item in orphaned_venvs:
         venv_path_to_remove = item.get("venv_path") if item["is_tracked"] else None
@@ -424,11 +427,7 @@ def prune_orphan(
             removed.append(item)
             if not dry_run and item["is_tracked"]:
                 # Remove from cache only for tracked venvs
-                try:
-                    cache.remove_mapping(Path(item["project_path"]))
-                except Exception as e:
-                    if not json_output:
-                        warning(f"  Failed to remove from cache: {e}")
+                cache_removals.append(Path(item["project_path"]))
 
             if verbose and not json_output:
                 echo(f"  Removed: {item['venv_path_expanded']}")
@@ -437,6 +436,14 @@ def prune_orphan(
             if not json_output:
                 error(f"  Failed to remove {item['venv_path_expanded']}: {error_msg}")
 
+    # Drop removed venvs from the cache in one write
+    if cache_removals:
+        try:
+            cache.remove_mappings(cache_removals)
+        except Exception as e:
+            if not json_output:
+                warning(f"Failed to remove from cache: {e}")
+
     # Output results
     if json_output:
         print_json(
@@ -569,11 +576,12 @@ def prune_current(
                 error(f"Failed to remove from cache: {e}")
             sys.exit(1)
 
-        # Clear .env.uve
+        # Clear the .env.uve that uve would use from here; truncating in
+        # place is a single call with no rewrite
         try:
             env_file = find_env_file()
             if env_file and env_file.exists():
-                write_env_file(env_file, {})
+                os.truncate(env_file, 0)
         except Exception as e:
             if not json_output:
                 warning(f"Failed to clear .env.uve: {e}")
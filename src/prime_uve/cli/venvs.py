@@ -0,0 +1,133 @@
+"""Venv directory helpers shared by the list and prune commands."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from prime_uve.core.paths import get_venv_base_dir
+
+
+def get_disk_usage(path: Path, workers: int | None = None) -> int:
+    """
+    Calculate total disk usage of a directory in bytes.
+
+    Top-level subdirectories (bin, lib, include, ...) are summed in parallel
+    on a thread pool, since the walk is dominated by I/O waits. A symlink to
+    a file counts the size of its target, as Path.is_file() would; symlinked
+    directories are not descended into.
+
+    Args:
+        path: Directory path
+        workers: Maximum worker threads (None for the executor default,
+            1 to walk sequentially)
+
+    Returns:
+        Total size in bytes
+    """
+    if workers == 1:
+        return _sum_tree(os.fspath(path))
+
+    total = 0
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        total += entry.stat().st_size
+                except OSError:
+                    pass
+    except OSError:
+        return 0
+
+    if len(subdirs) < 2:
+        return total + sum(_sum_tree(subdir) for subdir in subdirs)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        total += sum(executor.map(_sum_tree, subdirs))
+    return total
+
+
+def _sum_tree(root: str) -> int:
+    """
+    Sum file sizes below a directory.
+
+    Uses os.fwalk where available, falling back to an explicit scandir stack.
+
+    Args:
+        root: Directory path
+
+    Returns:
+        Total size in bytes (unreadable entries count as 0)
+    """
+    if not hasattr(os, "fwalk"):
+        return _scandir_sum_tree(root)
+
+    # fwalk yields a directory fd per level, so each stat is resolved
+    # relative to it instead of re-walking the full path from the root.
+    # Symlinked directories are listed in dirs but not descended into.
+    total = 0
+    try:
+        for _root, _dirs, files, root_fd in os.fwalk(root):
+            for name in files:
+                try:
+                    total += os.stat(name, dir_fd=root_fd).st_size
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return total
+
+
+def _scandir_sum_tree(root: str) -> int:
+    """
+    Sum file sizes below a directory with an explicit scandir stack.
+
+    Args:
+        root: Directory path
+
+    Returns:
+        Total size in bytes (unreadable entries count as 0)
+    """
+    total = 0
+    # DirEntry caches the type from readdir, so only files and symlinks
+    # need a stat call
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            total += entry.stat().st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    return total
+
+
+def scan_venv_directory() -> list[Path]:
+    """
+    Scan venv base directory for all venv directories.
+
+    Returns:
+        List of venv directory paths
+    """
+    venv_base = get_venv_base_dir()
+
+    # DirEntry carries the type from readdir, so no per-entry stat is needed.
+    # Symlinks are skipped: they are not venvs prime-uve created.
+    try:
+        with os.scandir(venv_base) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        return []  # Missing or unreadable base directory
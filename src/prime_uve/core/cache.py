@@ -6,6 +6,9 @@ mappings. It supports validation, migration, and concurrent access through file
 
 import json
 import logging
+import os
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,6 +20,11 @@ from .paths import expand_path_variables
 
 logger = logging.getLogger(__name__)
 
+# Files modified this recently are never served from the in-memory snapshot:
+# another process's rewrite within the same mtime tick that keeps the size
+# (possibly onto a reused inode) would be indistinguishable ("racy" entry)
+_RACY_WINDOW_NS = 2_000_000_000
+
 
 class CacheError(Exception):
     """Raised when cache operations fail."""
@@ -61,6 +69,8 @@ class Cache:
         self._cache_path = cache_path or self._default_cache_path()
         self._lock_path = self._cache_path.with_suffix(".lock")
         self._lock = FileLock(self._lock_path, timeout=10)
+        # Last data read, keyed by the file's (device, inode, mtime, size)
+        self._snapshot: tuple[tuple[int, int, int, int], dict] | None = None
 
     @staticmethod
     def _default_cache_path() -> Path:
@@ -68,20 +78,54 @@ class Cache:
         home = Path.home()
         return home / ".prime-uve" / "cache.json"
 
+    @staticmethod
+    def _snapshot_key(st: os.stat_result) -> tuple[int, int, int, int] | None:
+        """Key identifying a version of the cache file on disk.
+
+        Returns None for files modified within the racy window, which must
+        not be trusted from (or stored in) the snapshot.
+        """
+        if time.time_ns() - st.st_mtime_ns <= _RACY_WINDOW_NS:
+            return None
+        return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _copy_data(data: dict) -> dict:
+        """Copy cache data deep enough that callers can mutate mappings."""
+        venvs = data["venvs"]
+        if isinstance(venvs, dict):
+            venvs = {
+                key: dict(entry) if isinstance(entry, dict) else entry
+                for key, entry in venvs.items()
+            }
+        return {**data, "venvs": venvs}
+
     def _load(self) -> dict:
         """Load cache with lock held.
 
+        The parsed file is kept as an in-memory snapshot and reused while the
+        file's device, inode, mtime and size are unchanged, so repeated calls
+        on one instance (e.g. list_all followed by remove_mapping) parse it
+        once. Recently modified files are always re-read.
+
         Returns:
             Cache data dict with 'version' and 'venvs' keys
         """
         try:
             with self._lock:
-                if not self._cache_path.exists():
+                try:
+                    key = self._snapshot_key(self._cache_path.stat())
+                except FileNotFoundError:
                     return {"version": self.CURRENT_VERSION, "venvs": {}}
+                except OSError:
+                    key = None
+
+                if self._snapshot is not None and self._snapshot[0] == key:
+                    return self._copy_data(self._snapshot[1])
 
                 try:
-                    with open(self._cache_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    # One read of the raw bytes; json.loads decodes UTF-8 itself
+                    data = json.loads(self._cache_path.read_bytes())
 
                     # Handle corrupted or invalid cache
                     if not isinstance(data, dict):
@@ -94,6 +138,8 @@ class Cache:
                     if "venvs" not in data:
                         data["venvs"] = {}
 
+                    if key is not None:
+                        self._snapshot = (key, self._copy_data(data))
                     return data
                 except json.JSONDecodeError:
                     logger.warning(
@@ -123,13 +169,18 @@ class Cache:
                 # Create parent directory if needed
                 self._cache_path.parent.mkdir(parents=True, exist_ok=True)
 
-                # Write to temp file then rename for atomicity
+                # Write to temp file then rename for atomicity. Serialize in
+                # one dumps call and write the bytes at once; json.dump would
+                # issue a file write per encoder chunk.
                 temp_path = self._cache_path.with_suffix(".tmp")
-                with open(temp_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2)
+                temp_path.write_bytes(json.dumps(data, indent=2).encode("utf-8"))
 
                 # Atomic rename
                 temp_path.replace(self._cache_path)
+
+                # The new file is inside the racy window; drop the old
+                # snapshot and let the next load re-read it
+                self._snapshot = None
         except Timeout:
             raise CacheError(
                 "Could not acquire cache lock after 10 seconds. "
@@ -240,6 +291,31 @@ class Cache:
         self._save(data)
         return True
 
+    def remove_mappings(self, project_paths: Iterable[Path]) -> int:
+        """Remove several project → venv mappings with a single cache write.
+
+        Args:
+            project_paths: Absolute paths to project directories
+
+        Returns:
+            Number of mappings removed (paths not in cache are skipped)
+
+        Raises:
+            CacheError: If cache cannot be written
+        """
+        project_keys = [str(project_path.resolve()) for project_path in project_paths]
+
+        data = self._load()
+
+        removed = 0
+        for project_key in project_keys:
+            if data["venvs"].pop(project_key, None) is not None:
+                removed += 1
+
+        if removed:
+            self._save(data)
+        return removed
+
     def list_all(self) -> dict[str, dict]:
         """Get all cached mappings.
 
@@ -5,10 +5,43 @@ variable-aware parsing. Variables like ${HOME} are preserved (not expanded)
 during read/write operations for cross-platform compatibility.
 """
 
+import errno
+import os
+import re
+import stat
+import time
+from collections import OrderedDict
 from pathlib import Path
 
 from .paths import expand_path_variables
 
+# One KEY=VALUE assignment, whitespace around key and value stripped. The key
+# must be non-empty and may not start with '#' (comment) or contain '='; the
+# value is everything after the first '='. Blank lines, comments and lines
+# without '=' do not match. Multiline and newline-bounded, so it can scan a
+# whole file with finditer or match a single line.
+_ENV_LINE = re.compile(
+    r"^[^\S\n]*([^\s#=][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE
+)
+
+# Parsed .env.uve contents keyed by path, validated against the file's
+# (st_dev, st_ino, st_mtime_ns, st_ctime_ns, st_size) so re-reading an
+# unchanged file skips the read and parse. The inode catches atomic
+# replacements that keep mtime and size; ctime catches chmod, so a file made
+# unreadable is re-read and reports the error. Least recently used entries are
+# evicted past _ENV_CACHE_SIZE.
+_ENV_CACHE: OrderedDict[Path, tuple[tuple[int, int, int, int, int], dict[str, str]]] = (
+    OrderedDict()
+)
+_ENV_CACHE_SIZE = 64
+
+# Files modified this recently are not cached: a rewrite within the same
+# mtime tick that keeps the size would be indistinguishable ("racy" entry)
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Shared remedy appended to "not found" errors from find_env_file_strict
+_INIT_HINT = "Run 'prime-uve init' to create one, or create it manually."
+
 
 class EnvFileError(Exception):
     """Raised when .env.uve operations fail."""
@@ -43,28 +76,10 @@ def find_env_file(start_path: Path | None = None) -> Path:
 
     start_path = start_path.resolve()
 
-    # Search for .env.uve starting from current path
-    current = start_path
-    project_root = None
-
     # Walk up directory tree to find .env.uve or project root
-    while True:
-        # Check if .env.uve exists in current directory
-        env_file = current / ".env.uve"
-        if env_file.exists():
-            return env_file
-
-        # Check if this is the project root (has pyproject.toml)
-        if (current / "pyproject.toml").exists():
-            project_root = current
-
-        # Check if we've reached the filesystem root
-        parent = current.parent
-        if parent == current:
-            # At filesystem root
-            break
-
-        current = parent
+    env_file, project_root = _walk_up(start_path)
+    if env_file is not None:
+        return env_file
 
     # No .env.uve found - create one
     if project_root:
@@ -76,7 +91,7 @@ def find_env_file(start_path: Path | None = None) -> Path:
 
     # Create empty file
     try:
-        env_file.touch()
+        _create_empty(env_file)
     except (OSError, PermissionError) as e:
         raise EnvFileError(f"Cannot create .env.uve at {env_file}: {e}") from e
 
@@ -112,40 +127,57 @@ def find_env_file_strict(start_path: Path | None = None) -> Path:
 
     start_path = start_path.resolve()
 
-    # Search for .env.uve starting from current path
-    current = start_path
+    # Walk up directory tree to find .env.uve or project root
+    env_file, project_root = _walk_up(start_path)
+    if env_file is not None:
+        return env_file
+
+    # No .env.uve found - raise error
+    if project_root:
+        raise EnvFileError(
+            f".env.uve not found in project at {project_root}\n{_INIT_HINT}"
+        )
+    else:
+        raise EnvFileError(
+            f".env.uve not found starting from {start_path}\n{_INIT_HINT}"
+        )
+
+
+def _walk_up(start_path: Path) -> tuple[Path | None, Path | None]:
+    """Walk up from start_path looking for .env.uve and the project root.
+
+    The walk works on plain strings so each level costs two stat calls and
+    no Path objects.
+
+    Args:
+        start_path: Resolved directory to start from
+
+    Returns:
+        (env_file, None) for the closest existing .env.uve, otherwise
+        (None, project_root) where project_root is the topmost directory
+        containing pyproject.toml, or None if there is none
+    """
+    current = str(start_path)
     project_root = None
 
-    # Walk up directory tree to find .env.uve or project root
     while True:
         # Check if .env.uve exists in current directory
-        env_file = current / ".env.uve"
-        if env_file.exists():
-            return env_file
+        env_file = os.path.join(current, ".env.uve")
+        if os.path.exists(env_file):
+            return Path(env_file), None
 
         # Check if this is the project root (has pyproject.toml)
-        if (current / "pyproject.toml").exists():
+        if os.path.exists(os.path.join(current, "pyproject.toml")):
             project_root = current
 
         # Check if we've reached the filesystem root
-        parent = current.parent
+        parent = os.path.dirname(current)
         if parent == current:
-            # At filesystem root
             break
 
         current = parent
 
-    # No .env.uve found - raise error
-    if project_root:
-        raise EnvFileError(
-            f".env.uve not found in project at {project_root}\n"
-            f"Run 'prime-uve init' to create one, or create it manually."
-        )
-    else:
-        raise EnvFileError(
-            f".env.uve not found starting from {start_path}\n"
-            f"Run 'prime-uve init' to create one, or create it manually."
-        )
+    return None, Path(project_root) if project_root else None
 
 
 def read_env_file(path: Path) -> dict[str, str]:
@@ -173,7 +205,13 @@ def read_env_file(path: Path) -> dict[str, str]:
         '${HOME}/prime-uve/venvs/myproject_a1b2c3d4'  # NOT expanded
     """
     try:
-        content = path.read_text(encoding="utf-8")
+        st = path.stat()
+        key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+        cached = _ENV_CACHE.get(path)
+        if cached is not None and cached[0] == key:
+            _ENV_CACHE.move_to_end(path)
+            return dict(cached[1])
+        content = _read_text(path)
     except FileNotFoundError as e:
         raise EnvFileError(f"File not found: {path}") from e
     except PermissionError as e:
@@ -181,30 +219,21 @@ def read_env_file(path: Path) -> dict[str, str]:
     except OSError as e:
         raise EnvFileError(f"Cannot read file {path}: {e}") from e
 
-    env_vars = {}
-
-    for line in content.splitlines():
-        # Strip whitespace
-        line = line.strip()
+    env_vars = _parse_env_text(content)
 
-        # Skip comments and empty lines
-        if not line or line.startswith("#"):
-            continue
+    if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+        _ENV_CACHE[path] = (key, dict(env_vars))
+        _ENV_CACHE.move_to_end(path)
+        if len(_ENV_CACHE) > _ENV_CACHE_SIZE:
+            _ENV_CACHE.popitem(last=False)
 
-        # Parse key=value
-        if "=" not in line:
-            # Ignore malformed lines without '='
-            continue
-
-        # Split on first '=' to allow '=' in values
-        key, _, value = line.partition("=")
-        key = key.strip()
-        value = value.strip()
+    return env_vars
 
-        if key:  # Ignore lines with empty key
-            env_vars[key] = value
 
-    return env_vars
+def _parse_env_text(content: str) -> dict[str, str]:
+    """Parse .env.uve text into a dict (see read_env_file for the rules)."""
+    # One C-level scan over the whole text; later assignments win
+    return {match[1]: match[2] for match in _ENV_LINE.finditer(content)}
 
 
 def write_env_file(path: Path, env_vars: dict[str, str]) -> None:
@@ -235,23 +264,83 @@ def write_env_file(path: Path, env_vars: dict[str, str]) -> None:
     # Sort keys for consistent output
     sorted_keys = sorted(env_vars.keys())
 
-    # Build content
-    lines = [f"{key}={env_vars[key]}" for key in sorted_keys]
-    content = "\n".join(lines)
+    _ENV_CACHE.pop(path, None)
 
-    # Add trailing newline if there's content
-    if content:
-        content += "\n"
+    # Build content in one join; every line (including the last) ends in \n
+    content = "".join(f"{key}={env_vars[key]}\n" for key in sorted_keys)
 
     # Write file
     try:
-        path.write_text(content, encoding="utf-8")
+        _atomic_write(path, content)
     except PermissionError as e:
         raise EnvFileError(f"Permission denied: {path}") from e
     except OSError as e:
         raise EnvFileError(f"Cannot write file {path}: {e}") from e
 
 
+def _read_text(path: Path) -> str:
+    """Read path as UTF-8 text.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    return path.read_text(encoding="utf-8")
+
+
+def _create_empty(path: Path) -> None:
+    """Create path as an empty file if it does not exist yet.
+
+    Like Path.touch(), the new file gets the default mode (0o666 minus umask).
+
+    Raises:
+        OSError: If the file cannot be created
+    """
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT, 0o666))
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    """Replace the contents of path without exposing a partially written file.
+
+    Content goes to a temporary file next to the target, which is then
+    renamed over it with os.replace. A symlinked .env.uve is written through
+    to its target, an existing file keeps its permission bits, and a new
+    file gets the default mode (0o666 minus umask), as with write_text.
+
+    Args:
+        path: File to write
+        content: Text to write (UTF-8)
+
+    Raises:
+        PermissionError: If the existing file is not writable
+        OSError: If the temporary file cannot be written or renamed
+    """
+    target = os.path.realpath(path)
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = None
+    else:
+        # os.replace only needs a writable directory; refuse to replace a
+        # file that write_text could not have opened for writing
+        if not os.access(target, os.W_OK):
+            raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), target)
+
+    tmp = f"{target}.{os.getpid()}.{os.urandom(4).hex()}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(content)
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
 def update_env_file(path: Path, updates: dict[str, str]) -> None:
     """Update specific variables in .env.uve file, preserving others.
 
@@ -271,6 +360,10 @@ def update_env_file(path: Path, updates: dict[str, str]) -> None:
     # Read existing variables (or start with empty dict if file doesn't exist)
     if path.exists():
         env_vars = read_env_file(path)
+
+        # Nothing to change: leave the file untouched
+        if all(env_vars.get(key) == value for key, value in updates.items()):
+            return
     else:
         env_vars = {}
 
@@ -308,45 +401,55 @@ def update_env_file_preserve_format(path: Path, updates: dict[str, str]) -> None
         write_env_file(path, updates)
         return
 
-    # Read existing content line by line
-    try:
-        content = path.read_text(encoding="utf-8")
-    except (FileNotFoundError, PermissionError, OSError) as e:
-        raise EnvFileError(f"Cannot read file {path}: {e}") from e
-
-    lines = content.splitlines()
     updated_keys = set()
     new_lines = []
+    changed = False
+    terminated = True  # whether the file ends with a newline
 
-    # Process existing lines
-    for line in lines:
-        stripped = line.strip()
-
-        # Preserve comments and empty lines as-is
-        if not stripped or stripped.startswith("#"):
-            new_lines.append(line)
-            continue
-
-        # Check if this is a variable assignment
-        if "=" in line:
-            key, _, value = line.partition("=")
-            key = key.strip()
-
-            # If this key is being updated, replace the line
-            if key in updates:
-                new_lines.append(f"{key}={updates[key]}")
-                updated_keys.add(key)
-            else:
-                # Keep the original line
-                new_lines.append(line)
-        else:
-            # Malformed line, keep as-is
-            new_lines.append(line)
+    # Read and process existing content line by line
+    try:
+        with path.open(encoding="utf-8") as fh:
+            for line in fh:
+                terminated = line.endswith("\n")
+                line = line.rstrip("\n")
+                match = _ENV_LINE.match(line)
+
+                # Replace assignments to updated keys; comments, empty and
+                # malformed lines and other assignments are kept as-is
+                if match and match[1] in updates:
+                    key = match[1]
+                    new_line = f"{key}={updates[key]}"
+                    changed = changed or new_line != line
+                    new_lines.append(new_line)
+                    updated_keys.add(key)
+                else:
+                    new_lines.append(line)
+    except (FileNotFoundError, PermissionError, OSError) as e:
+        raise EnvFileError(f"Cannot read file {path}: {e}") from e
 
     # Append any new variables that weren't in the file
     for key, value in updates.items():
         if key not in updated_keys:
             new_lines.append(f"{key}={value}")
+            changed = True
+
+    # Every updated line already reads exactly as it would be written
+    if not changed:
+        return
+
+    _ENV_CACHE.pop(path, None)
+
+    # Only new keys: append them rather than rewriting the whole file
+    if not updated_keys:
+        appended = "".join(f"{key}={value}\n" for key, value in updates.items())
+        if not terminated:
+            appended = "\n" + appended
+        try:
+            with path.open("a", encoding="utf-8") as fh:
+                fh.write(appended)
+        except (PermissionError, OSError) as e:
+            raise EnvFileError(f"Cannot write file {path}: {e}") from e
+        return
 
     # Build final content
     content = "\n".join(new_lines)
@@ -357,7 +460,7 @@ def update_env_file_preserve_format(path: Path, updates: dict[str, str]) -> None
 
     # Write file
     try:
-        path.write_text(content, encoding="utf-8")
+        _atomic_write(path, content)
     except (PermissionError, OSError) as e:
         raise EnvFileError(f"Cannot write file {path}: {e}") from e
 
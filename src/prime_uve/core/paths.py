@@ -4,12 +4,37 @@ This module provides cross-platform path generation using ${HOME} variable
 for venv paths, ensuring compatibility across Windows, macOS, and Linux.
 """
 
+import functools
 import hashlib
 import os
+import re
 import sys
+import time
 import tomllib
+from collections import OrderedDict
 from pathlib import Path
 
+# A run of characters that are not alphanumeric (str.isalnum), used to turn
+# project names into filesystem-safe slugs
+_NON_ALNUM_RUN = re.compile(r"[\W_]+")
+
+# Unexpanded directory holding every venv; ${HOME} is kept literal so
+# .env.uve files stay portable across users and platforms
+_VENV_ROOT = "${HOME}/prime-uve/venvs"
+
+# Parsed pyproject.toml contents keyed by path, validated against the file's
+# (st_dev, st_ino, st_mtime_ns, st_size) so get_project_name and
+# get_project_metadata parse an unchanged file once between them. Least
+# recently used entries are evicted past _PYPROJECT_CACHE_SIZE.
+_PYPROJECT_CACHE: OrderedDict[str, tuple[tuple[int, int, int, int], dict]] = (
+    OrderedDict()
+)
+_PYPROJECT_CACHE_SIZE = 64
+
+# Files modified this recently are not cached: a rewrite within the same
+# mtime tick that keeps the size would be indistinguishable ("racy" entry)
+_RACY_WINDOW_NS = 2_000_000_000
+
 
 def generate_hash(project_path: Path) -> str:
     """Generate a deterministic 8-character hash from a project path.
@@ -28,12 +53,61 @@ def generate_hash(project_path: Path) -> str:
         >>> generate_hash(Path("/mnt/share/my-project"))
         'a1b2c3d4'
     """
-    # Resolve symlinks and normalize to POSIX style for cross-platform consistency
-    normalized = project_path.resolve().as_posix()
+    # Resolve symlinks and normalize to POSIX style for cross-platform
+    # consistency. realpath is what Path.resolve() calls; using it directly
+    # skips building a Path only to render it back to a string.
+    normalized = os.path.realpath(project_path)
+    if os.sep != "/":
+        normalized = normalized.replace(os.sep, "/")
     hash_obj = hashlib.sha256(normalized.encode())
     return hash_obj.hexdigest()[:8]
 
 
+def load_pyproject(
+    pyproject_path: Path, st: os.stat_result | None = None
+) -> dict | None:
+    """Read and parse a pyproject.toml, reusing the parse while it is unchanged.
+
+    The returned dict is shared with the cache and must not be mutated.
+
+    Args:
+        pyproject_path: Path to the pyproject.toml file
+        st: Result of a stat() the caller already made on the file (optional)
+
+    Returns:
+        Parsed TOML document, or None if the file is missing or unreadable
+
+    Raises:
+        tomllib.TOMLDecodeError: If the file is not valid TOML
+    """
+    if st is None:
+        try:
+            st = os.stat(pyproject_path)
+        except OSError:
+            return None
+
+    path = os.fspath(pyproject_path)
+    key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _PYPROJECT_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        _PYPROJECT_CACHE.move_to_end(path)
+        return cached[1]
+
+    try:
+        raw = pyproject_path.read_bytes()
+    except OSError:
+        return None
+    data = tomllib.loads(raw.decode("utf-8"))
+
+    if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+        _PYPROJECT_CACHE[path] = (key, data)
+        _PYPROJECT_CACHE.move_to_end(path)
+        if len(_PYPROJECT_CACHE) > _PYPROJECT_CACHE_SIZE:
+            _PYPROJECT_CACHE.popitem(last=False)
+
+    return data
+
+
 def get_project_name(project_path: Path) -> str:
     """Extract and sanitize project name from pyproject.toml or directory name.
 
@@ -54,31 +128,23 @@ def get_project_name(project_path: Path) -> str:
     name = None
 
     # Try to get name from pyproject.toml
-    pyproject_path = project_path / "pyproject.toml"
-    if pyproject_path.exists():
-        try:
-            with open(pyproject_path, "rb") as f:
-                data = tomllib.load(f)
-                name = data.get("project", {}).get("name")
-        except (tomllib.TOMLDecodeError, KeyError, OSError):
-            # Fall through to use directory name
-            pass
+    try:
+        data = load_pyproject(project_path / "pyproject.toml")
+        if data is not None:
+            name = data.get("project", {}).get("name")
+    except (tomllib.TOMLDecodeError, KeyError):
+        # Fall through to use directory name
+        pass
 
     # Fall back to directory name
     if not name:
         name = project_path.name
 
-    # Sanitize: lowercase, replace non-alphanumeric with hyphens
-    sanitized = ""
-    for char in name.lower():
-        if char.isalnum():
-            sanitized += char
-        elif sanitized and sanitized[-1] != "-":
-            # Add hyphen, but avoid consecutive hyphens
-            sanitized += "-"
-
-    # Remove trailing hyphens and handle empty result
-    sanitized = sanitized.rstrip("-")
+    # Sanitize: lowercase, replace each run of non-alphanumerics with a hyphen
+    sanitized = _NON_ALNUM_RUN.sub("-", name.lower())
+
+    # Remove leading/trailing hyphens and handle empty result
+    sanitized = sanitized.strip("-")
     return sanitized if sanitized else "project"
 
 
@@ -103,22 +169,41 @@ def generate_venv_path(project_path: Path) -> str:
     path_hash = generate_hash(project_path)
 
     # Always use ${HOME} for cross-platform compatibility
-    return f"${{HOME}}/prime-uve/venvs/{project_name}_{path_hash}"
+    return f"{_VENV_ROOT}/{project_name}_{path_hash}"
+
 
+def get_home_dir() -> str:
+    """Resolve the directory that ${HOME} stands for on this platform.
 
-def expand_path_variables(path: str) -> Path:
+    On Windows, uses HOME, then USERPROFILE.
+    On Unix/macOS, uses HOME.
+    Falls back to os.path.expanduser('~') if variables not set.
+
+    Returns:
+        Home directory as a string
+    """
+    if sys.platform == "win32":
+        return (
+            os.environ.get("HOME")
+            or os.environ.get("USERPROFILE")
+            or os.path.expanduser("~")
+        )
+    return os.environ.get("HOME") or os.path.expanduser("~")
+
+
+def expand_path_variables(path: str, home: str | None = None) -> Path:
     """Expand ${HOME} variable to actual home directory path.
 
     Converts a path string with ${HOME} variable to an actual pathlib.Path
     with the variable expanded. Used for local operations like checking if
     a venv exists.
 
-    On Windows, uses USERPROFILE environment variable.
-    On Unix/macOS, uses HOME environment variable.
-    Falls back to os.path.expanduser('~') if variables not set.
+    The home directory is resolved with get_home_dir() unless the caller
+    passes one in, which lets loops over many cache entries resolve it once.
 
     Args:
         path: Path string containing ${HOME} variable
+        home: Pre-resolved home directory (optional)
 
     Returns:
         pathlib.Path with ${HOME} expanded to actual directory
@@ -128,15 +213,12 @@ def expand_path_variables(path: str) -> Path:
         Path('/home/user/prime-uve/venvs/myproject')  # On Linux
         Path('C:/Users/user/prime-uve/venvs/myproject')  # On Windows
     """
-    # Determine home directory based on platform
-    if sys.platform == "win32":
-        home = (
-            os.environ.get("HOME")
-            or os.environ.get("USERPROFILE")
-            or os.path.expanduser("~")
-        )
-    else:
-        home = os.environ.get("HOME") or os.path.expanduser("~")
+    # Literal paths (e.g. already expanded ones) need no home lookup
+    if "${HOME}" not in path:
+        return Path(path)
+
+    if home is None:
+        home = get_home_dir()
 
     # Replace ${HOME} with actual home directory
     expanded = path.replace("${HOME}", home)
@@ -170,4 +252,10 @@ def get_venv_base_dir() -> Path:
     Returns:
         Path to venv base directory
     """
-    return expand_path_variables("${HOME}/prime-uve/venvs")
+    return _venv_base_dir(get_home_dir())
+
+
+@functools.lru_cache(maxsize=8)
+def _venv_base_dir(home: str) -> Path:
+    # Keyed on the resolved home so a changed HOME never returns a stale path
+    return expand_path_variables(_VENV_ROOT, home)
@@ -5,11 +5,13 @@ pyproject.toml) and extract project metadata needed for venv path generation
 and display.
 """
 
+import os
+import stat
 import tomllib
 from dataclasses import dataclass
 from pathlib import Path
 
-from .paths import get_project_name
+from .paths import get_project_name, load_pyproject
 
 
 class ProjectError(Exception):
@@ -18,7 +20,7 @@ class ProjectError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectMetadata:
     """Project metadata extracted from pyproject.toml and filesystem."""
 
@@ -59,16 +61,16 @@ def find_project_root(start_path: Path | None = None) -> Path | None:
         >>> (root / "pyproject.toml").exists()
         True
     """
-    current = (start_path or Path.cwd()).resolve()
+    # realpath is what Path.resolve() calls; the walk only needs the string
+    current = os.path.realpath(start_path or os.getcwd())
 
-    # Walk up directory tree
+    # Walk up directory tree (on strings; a Path is built only for the result)
     while True:
-        pyproject_path = current / "pyproject.toml"
-        if pyproject_path.exists():
-            return current
+        if os.path.exists(os.path.join(current, "pyproject.toml")):
+            return Path(current)
 
         # Check if we're at filesystem root
-        parent = current.parent
+        parent = os.path.dirname(current)
         if parent == current:
             # We've reached the root (parent is same as current)
             return None
@@ -121,19 +123,25 @@ def get_project_metadata(project_path: Path) -> ProjectMetadata:
         >>> metadata.python_version
         '>=3.13'
     """
-    # Validate path
+    # Validate path (one stat answers both "exists" and "is a directory")
     try:
-        resolved_path = project_path.resolve()
-        if not resolved_path.exists():
-            raise ProjectError(f"Project path does not exist: {project_path}")
-        if not resolved_path.is_dir():
-            raise ProjectError(f"Project path is not a directory: {project_path}")
+        resolved_path = Path(os.path.realpath(project_path))
+        mode = os.stat(resolved_path).st_mode
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise ProjectError(f"Project path does not exist: {project_path}") from e
     except (OSError, RuntimeError) as e:
         raise ProjectError(f"Invalid project path: {project_path}") from e
+    if not stat.S_ISDIR(mode):
+        raise ProjectError(f"Project path is not a directory: {project_path}")
 
-    # Check if pyproject.toml exists
+    # Check if pyproject.toml exists; the stat is reused by the loader below
     pyproject_path = resolved_path / "pyproject.toml"
-    has_pyproject = pyproject_path.exists()
+    try:
+        pyproject_stat = os.stat(pyproject_path)
+        has_pyproject = True
+    except OSError:
+        pyproject_stat = None
+        has_pyproject = False
 
     # Initialize metadata with defaults
     name = None
@@ -143,8 +151,9 @@ def get_project_metadata(project_path: Path) -> ProjectMetadata:
     # Try to extract metadata from pyproject.toml
     if has_pyproject:
         try:
-            with open(pyproject_path, "rb") as f:
-                data = tomllib.load(f)
+            # Parsed once and shared with get_project_name's fallback below
+            data = load_pyproject(pyproject_path, pyproject_stat)
+            if data is not None:
                 project_section = data.get("project", {})
 
                 # Extract name (must be non-empty string)
@@ -160,7 +169,7 @@ def get_project_metadata(project_path: Path) -> ProjectMetadata:
                 python_version = project_section.get("requires-python")
                 description = project_section.get("description")
 
-        except (tomllib.TOMLDecodeError, OSError, KeyError):
+        except (tomllib.TOMLDecodeError, KeyError):
             # Malformed or unreadable pyproject.toml - continue with fallback
             pass
 
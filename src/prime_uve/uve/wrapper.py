@@ -48,8 +48,8 @@ def main() -> None:
     # 2. Ensure HOME is set on Windows for cross-platform compatibility
     env = os.environ.copy()
     if sys.platform == "win32" and "HOME" not in env:
-        # Set HOME from USERPROFILE on Windows
-        env["HOME"] = env.get("USERPROFILE", os.path.expanduser("~"))
+        # Set HOME from USERPROFILE on Windows; only resolve ~ if it is unset
+        env["HOME"] = env.get("USERPROFILE") or os.path.expanduser("~")
 
     # 3. Build command: uv run --env-file .env.uve -- uv [args...]
     args = sys.argv[1:]  # All args after 'uve'
@@ -2,6 +2,7 @@
 
 import json
 import multiprocessing
+import os
 import sys
 import time
 
@@ -106,6 +107,31 @@ def test_remove_mapping_not_found(tmp_path):
     assert result is False
 
 
+def test_remove_mappings(tmp_path):
+    """Removing several mappings drops them all in one write."""
+    cache_file = tmp_path / "cache.json"
+    cache = Cache(cache_file)
+
+    projects = []
+    for name in ["project1", "project2", "project3"]:
+        project_path = tmp_path / name
+        project_path.mkdir()
+        cache.add_mapping(
+            project_path,
+            generate_venv_path(project_path),
+            name,
+            generate_hash(project_path),
+        )
+        projects.append(project_path)
+
+    missing = tmp_path / "not-cached"
+    removed = cache.remove_mappings([projects[0], projects[2], missing])
+
+    assert removed == 2
+    mappings = Cache(cache_file).list_all()
+    assert list(mappings) == [str(projects[1].resolve())]
+
+
 def test_list_all_empty(tmp_path):
     """Empty cache returns empty dict."""
     cache_file = tmp_path / "cache.json"
@@ -192,6 +218,72 @@ def test_persistence_across_instances(tmp_path):
     assert mapping["project_name"] == project_name
 
 
+def test_snapshot_reused_until_file_changes(tmp_path, monkeypatch):
+    """Repeated loads reuse the parsed snapshot until another writer replaces it."""
+    cache_file = tmp_path / "cache.json"
+    cache = Cache(cache_file)
+
+    project_path = tmp_path / "test-project"
+    project_path.mkdir()
+    cache.add_mapping(project_path, "${HOME}/venv", "test-project", "abc12345")
+    # Age the file past the racy window so its snapshot may be trusted
+    old = cache_file.stat().st_mtime - 10
+    os.utime(cache_file, (old, old))
+
+    loads = []
+    original_loads = json.loads
+
+    def counting_loads(*args, **kwargs):
+        loads.append(1)
+        return original_loads(*args, **kwargs)
+
+    monkeypatch.setattr(json, "loads", counting_loads)
+
+    assert str(project_path.resolve()) in cache.list_all()
+    assert cache.get_mapping(project_path) is not None
+    assert loads == [1]
+
+    # Another instance replaces the file, so the snapshot is stale
+    Cache(cache_file).clear()
+    assert cache.list_all() == {}
+    assert loads == [1, 1]
+
+
+def test_snapshot_not_trusted_for_recent_writes(tmp_path, monkeypatch):
+    """A file modified within the racy window is re-read on every load."""
+    cache_file = tmp_path / "cache.json"
+    cache = Cache(cache_file)
+
+    project_path = tmp_path / "test-project"
+    project_path.mkdir()
+    cache.add_mapping(project_path, "${HOME}/venv", "test-project", "abc12345")
+    cache.list_all()
+
+    # Same-size rewrite that keeps the mtime: only a re-read can see it
+    st = cache_file.stat()
+    content = cache_file.read_text().replace("abc12345", "def67890")
+    cache_file.write_text(content)
+    os.utime(cache_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    mapping = cache.get_mapping(project_path)
+    assert mapping["path_hash"] == "def67890"
+
+
+def test_snapshot_not_shared_with_callers(tmp_path):
+    """Mutating returned mappings does not leak into later loads."""
+    cache_file = tmp_path / "cache.json"
+    cache = Cache(cache_file)
+
+    project_path = tmp_path / "test-project"
+    project_path.mkdir()
+    cache.add_mapping(project_path, "${HOME}/venv", "test-project", "abc12345")
+
+    mappings = cache.list_all()
+    mappings.clear()
+
+    assert len(cache.list_all()) == 1
+
+
 def test_cache_created_if_missing(tmp_path):
     """Cache file is created on first write."""
     cache_file = tmp_path / "cache.json"
@@ -185,6 +185,27 @@ def test_init_force_overwrites(runner, mock_project, cache_file, monkeypatch):
         assert "Created .env.uve" in result.output or "Added to cache" in result.output
 
 
+def test_init_force_generates_venv_path_once(
+    runner, mock_project, cache_file, monkeypatch
+):
+    """Test that --force reuses one generated venv path for check and write."""
+    monkeypatch.chdir(mock_project)
+
+    with patch(
+        "prime_uve.core.cache.Cache._default_cache_path", return_value=cache_file
+    ):
+        runner.invoke(cli, ["init"])
+
+        with patch(
+            "prime_uve.cli.init.generate_venv_path",
+            return_value="${HOME}/prime-uve/venvs/test-project_12345678",
+        ) as mock_generate:
+            result = runner.invoke(cli, ["init", "--force", "--yes"])
+
+        assert result.exit_code == 0
+        assert mock_generate.call_count == 1
+
+
 def test_init_force_preserves_other_vars(runner, mock_project, cache_file, monkeypatch):
     """Test that --force preserves other env vars in .env.uve."""
     monkeypatch.chdir(mock_project)
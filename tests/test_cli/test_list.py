@@ -185,6 +185,10 @@ class TestHelperFunctions:
         assert truncated.startswith("...")
         assert truncated.endswith("directory")
 
+    def test_truncate_path_no_room_for_tail(self):
+        """Test truncating to exactly the ellipsis length."""
+        assert truncate_path("~/venvs/test", 3) == "..."
+
     def test_get_disk_usage_empty_dir(self, tmp_path):
         """Test disk usage calculation for empty directory."""
         empty_dir = tmp_path / "empty"
@@ -207,6 +211,36 @@ class TestHelperFunctions:
         usage = get_disk_usage(test_dir)
         assert usage == 600  # 100 + 200 + 300
 
+    def test_get_disk_usage_counts_symlinked_files(self, tmp_path):
+        """Test symlinked files count their target and linked dirs are skipped."""
+        target_dir = tmp_path / "target"
+        target_dir.mkdir()
+        (target_dir / "python").write_text("p" * 100)
+
+        test_dir = tmp_path / "test"
+        (test_dir / "bin").mkdir(parents=True)
+        try:
+            (test_dir / "bin" / "python").symlink_to(target_dir / "python")
+            (test_dir / "bin" / "broken").symlink_to(tmp_path / "missing")
+            (test_dir / "linked").symlink_to(target_dir, target_is_directory=True)
+        except OSError:
+            pytest.skip("Cannot create symlinks on this platform")
+        (test_dir / "file.txt").write_text("a" * 50)
+
+        assert get_disk_usage(test_dir) == 150
+        assert get_disk_usage(test_dir, workers=1) == 150
+
+    def test_get_disk_usage_without_fwalk(self, tmp_path, monkeypatch):
+        """Test the scandir fallback used where os.fwalk is unavailable."""
+        test_dir = tmp_path / "test"
+        (test_dir / "subdir").mkdir(parents=True)
+        (test_dir / "file1.txt").write_text("a" * 100)
+        (test_dir / "subdir" / "file2.txt").write_text("b" * 200)
+
+        monkeypatch.delattr("os.fwalk", raising=False)
+        assert get_disk_usage(test_dir) == 300
+        assert get_disk_usage(test_dir, workers=1) == 300
+
     def test_get_disk_usage_nonexistent(self, tmp_path):
         """Test disk usage for non-existent directory."""
         nonexistent = tmp_path / "does_not_exist"
@@ -435,6 +469,32 @@ class TestListCommandCLI:
         assert "Created:" in result.output
         assert "abc123" in result.output
 
+    def test_list_table_skips_disk_usage(self, runner, tmp_path, monkeypatch):
+        """Test the compact table does not walk venvs for sizes it never shows."""
+        project = tmp_path / "test"
+        project.mkdir()
+        venv = "${HOME}/prime-uve/venvs/test_abc123"
+        (project / ".env.uve").write_text(f"UV_PROJECT_ENVIRONMENT={venv}\n")
+
+        mock_cache_instance = Mock()
+        mock_cache_instance.list_all.return_value = {
+            str(project): {
+                "venv_path": venv,
+                "project_name": "test",
+                "path_hash": "abc123",
+                "created_at": "2025-12-01T10:00:00Z",
+            }
+        }
+        monkeypatch.setattr("prime_uve.cli.list.Cache", lambda: mock_cache_instance)
+        monkeypatch.setattr("prime_uve.cli.list.scan_venv_directory", lambda: [])
+        mock_disk_usage = Mock(return_value=0)
+        monkeypatch.setattr("prime_uve.cli.list.get_disk_usage", mock_disk_usage)
+
+        result = runner.invoke(cli, ["list"])
+
+        assert result.exit_code == 0
+        mock_disk_usage.assert_not_called()
+
     def test_list_json_output(self, runner, tmp_path, monkeypatch):
         """Test --json outputs valid JSON."""
         # Setup
@@ -1,7 +1,8 @@
 """Tests for the prune command."""
 
 import json
-from unittest.mock import Mock, patch
+import os
+from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
@@ -10,83 +11,72 @@ from prime_uve.cli.prune import (
     format_bytes,
     get_disk_usage,
     is_orphaned,
+    measure_venvs,
+    prune_all,
+    prune_orphan,
     remove_venv_directory,
+    scan_venv_directory,
 )
 from prime_uve.cli.main import cli
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner():
-    """Click CLI test runner."""
+    """Click CLI test runner (stateless between invocations, so shared)."""
     return CliRunner()
 
 
-@pytest.fixture
-def mock_cache(tmp_path):
-    """Mock cache with test data."""
-    cache_data = {
-        str(tmp_path / "project1"): {
-            "venv_path": "${HOME}/prime-uve/venvs/project1_abc123",
-            "project_name": "project1",
-            "path_hash": "abc123",
-            "created_at": "2025-12-01T10:00:00Z",
-        },
-        str(tmp_path / "project2"): {
-            "venv_path": "${HOME}/prime-uve/venvs/project2_def456",
-            "project_name": "project2",
-            "path_hash": "def456",
-            "created_at": "2025-12-02T11:00:00Z",
-        },
-    }
-    return cache_data
-
-
-@pytest.fixture
-def venv_dir(tmp_path):
-    """Create a test venv directory structure."""
-    venv_base = tmp_path / "venvs"
-    venv_base.mkdir()
-
-    # Create some test venv directories with files
-    venv1 = venv_base / "project1_abc123"
-    venv1.mkdir()
-    (venv1 / "bin").mkdir()
-    (venv1 / "bin" / "python").write_text("#!/usr/bin/env python")
-
-    venv2 = venv_base / "project2_def456"
-    venv2.mkdir()
-    (venv2 / "lib").mkdir()
-    (venv2 / "lib" / "site.py").write_text("# site packages")
-
-    return venv_base
+class FakeCache:
+    """Dict-backed stand-in for Cache that records mutating calls."""
 
+    def __init__(self, venvs: dict | None = None):
+        self.venvs = dict(venvs or {})
+        self.clear_calls = 0
+        self.remove_mapping_calls = []
+        self.remove_mappings_calls = []
 
-class TestHelperFunctions:
-    """Tests for helper functions."""
+    def list_all(self) -> dict:
+        return dict(self.venvs)
+
+    def get_mapping(self, project_path):
+        return self.venvs.get(str(project_path))
+
+    def clear(self) -> None:
+        self.clear_calls += 1
+        self.venvs.clear()
 
-    def test_format_bytes_zero(self):
-        """Test formatting zero bytes."""
-        assert format_bytes(0) == "0 B"
+    def remove_mapping(self, project_path) -> bool:
+        self.remove_mapping_calls.append(project_path)
+        return self.venvs.pop(str(project_path), None) is not None
 
-    def test_format_bytes_small(self):
-        """Test formatting small byte values."""
-        assert format_bytes(100) == "100 B"
-        assert format_bytes(1023) == "1023 B"
+    def remove_mappings(self, project_paths) -> int:
+        project_paths = list(project_paths)
+        self.remove_mappings_calls.append(project_paths)
+        return sum(
+            self.venvs.pop(str(path), None) is not None for path in project_paths
+        )
 
-    def test_format_bytes_kb(self):
-        """Test formatting kilobytes."""
-        assert format_bytes(1024) == "1.0 KB"
-        assert format_bytes(1536) == "1.5 KB"
 
-    def test_format_bytes_mb(self):
-        """Test formatting megabytes."""
-        assert format_bytes(1024 * 1024) == "1.0 MB"
-        assert format_bytes(int(125.5 * 1024 * 1024)) == "125.5 MB"
+class TestHelperFunctions:
+    """Tests for helper functions."""
 
-    def test_format_bytes_gb(self):
-        """Test formatting gigabytes."""
-        assert format_bytes(1024 * 1024 * 1024) == "1.0 GB"
-        assert format_bytes(int(2.5 * 1024 * 1024 * 1024)) == "2.5 GB"
+    @pytest.mark.parametrize(
+        "size,expected",
+        [
+            (0, "0 B"),
+            (100, "100 B"),
+            (1023, "1023 B"),
+            (1024, "1.0 KB"),
+            (1536, "1.5 KB"),
+            (1024 * 1024, "1.0 MB"),
+            (int(125.5 * 1024 * 1024), "125.5 MB"),
+            (1024 * 1024 * 1024, "1.0 GB"),
+            (int(2.5 * 1024 * 1024 * 1024), "2.5 GB"),
+        ],
+    )
+    def test_format_bytes(self, size, expected):
+        """Test formatting byte counts across units."""
+        assert format_bytes(size) == expected
 
     def test_get_disk_usage_empty_dir(self, tmp_path):
         """Test disk usage calculation for empty directory."""
@@ -103,6 +93,30 @@ class TestHelperFunctions:
         usage = get_disk_usage(test_dir)
         assert usage >= 300  # At least the file content size
 
+    def test_get_disk_usage_parallel_matches_sequential(self, tmp_path):
+        """Test the threaded walk sums the same bytes as a sequential one."""
+        test_dir = tmp_path / "venv"
+        for subdir, size in [("bin", 10), ("lib/python/site", 200), ("include", 30)]:
+            (test_dir / subdir).mkdir(parents=True)
+            (test_dir / subdir / "file").write_text("x" * size)
+        (test_dir / "pyvenv.cfg").write_text("y" * 5)
+
+        assert get_disk_usage(test_dir) == 245
+        assert get_disk_usage(test_dir, workers=1) == 245
+
+    def test_measure_venvs_keeps_order(self, tmp_path):
+        """Test concurrent measurement returns sizes in input order."""
+        paths = []
+        for name, size in [("a", 100), ("b", 0), ("c", 300)]:
+            venv = tmp_path / name
+            venv.mkdir()
+            if size:
+                (venv / "file").write_text("x" * size)
+            paths.append(venv)
+        paths.append(tmp_path / "missing")
+
+        assert measure_venvs(paths) == [100, 0, 300, 0]
+
     def test_get_disk_usage_nonexistent(self, tmp_path):
         """Test disk usage for nonexistent directory."""
         nonexistent = tmp_path / "nonexistent"
@@ -153,6 +167,29 @@ class TestHelperFunctions:
 
         assert is_orphaned(str(project_path), cache_entry) is False
 
+    @patch("prime_uve.cli.venvs.get_venv_base_dir")
+    def test_scan_venv_directory_only_real_dirs(self, mock_get_base, tmp_path):
+        """Test scanning lists venv directories, not files or symlinks."""
+        venv_base = tmp_path / "venvs"
+        (venv_base / "project_abc123").mkdir(parents=True)
+        (venv_base / "stray.txt").write_text("not a venv")
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        try:
+            (venv_base / "linked").symlink_to(outside)
+        except OSError:
+            pytest.skip("Cannot create symlinks on this platform")
+        mock_get_base.return_value = venv_base
+
+        assert scan_venv_directory() == [venv_base / "project_abc123"]
+
+    @patch("prime_uve.cli.venvs.get_venv_base_dir")
+    def test_scan_venv_directory_missing_base(self, mock_get_base, tmp_path):
+        """Test scanning a missing base directory finds nothing."""
+        mock_get_base.return_value = tmp_path / "missing"
+
+        assert scan_venv_directory() == []
+
     def test_remove_venv_directory_success(self, tmp_path):
         """Test successful venv removal."""
         venv_dir = tmp_path / "test_venv"
@@ -177,6 +214,20 @@ class TestHelperFunctions:
         assert error is None
         assert venv_dir.exists()  # Should still exist
 
+    def test_remove_venv_directory_expands_home(self, tmp_path):
+        """Test ${HOME} in the venv path is expanded before removal."""
+        venv_dir = tmp_path / "prime-uve" / "venvs" / "x"
+        venv_dir.mkdir(parents=True)
+
+        with patch.dict(os.environ, {"HOME": str(tmp_path)}):
+            success, error = remove_venv_directory(
+                "${HOME}/prime-uve/venvs/x", dry_run=False
+            )
+
+        assert success is True
+        assert error is None
+        assert not venv_dir.exists()
+
     def test_remove_venv_directory_nonexistent(self, tmp_path):
         """Test removing nonexistent venv (should succeed)."""
         nonexistent = tmp_path / "nonexistent"
@@ -207,23 +258,24 @@ class TestPruneCommand:
     @patch("prime_uve.cli.prune.Cache")
     def test_prune_command_all_dry_run(self, mock_cache_class, runner, tmp_path):
         """Test prune --all in dry run mode."""
-        # Setup mock cache
-        mock_cache = Mock()
-        mock_cache.list_all.return_value = {
-            str(tmp_path / "project1"): {
-                "venv_path": "${HOME}/prime-uve/venvs/project1_abc123",
-                "project_name": "project1",
-                "path_hash": "abc123",
-                "created_at": "2025-12-01T10:00:00Z",
+        # Setup fake cache
+        fake_cache = FakeCache(
+            {
+                str(tmp_path / "project1"): {
+                    "venv_path": "${HOME}/prime-uve/venvs/project1_abc123",
+                    "project_name": "project1",
+                    "path_hash": "abc123",
+                    "created_at": "2025-12-01T10:00:00Z",
+                }
             }
-        }
-        mock_cache_class.return_value = mock_cache
+        )
+        mock_cache_class.return_value = fake_cache
 
         result = runner.invoke(cli, ["prune", "--all", "--dry-run", "--yes"])
 
         assert result.exit_code == 0
         assert "[DRY RUN]" in result.output
-        mock_cache.clear.assert_not_called()  # Should not clear in dry run
+        assert fake_cache.clear_calls == 0  # Should not clear in dry run
 
     @patch("prime_uve.cli.prune.scan_venv_directory")
     @patch("prime_uve.cli.prune.Cache")
@@ -231,10 +283,9 @@ class TestPruneCommand:
         self, mock_cache_class, mock_scan, runner, tmp_path
     ):
         """Test prune --orphan with JSON output."""
-        # Setup mock cache
-        mock_cache = Mock()
-        mock_cache.list_all.return_value = {}
-        mock_cache_class.return_value = mock_cache
+        # Setup fake cache
+        fake_cache = FakeCache()
+        mock_cache_class.return_value = fake_cache
         # Mock scan_venv_directory to return no venvs
         mock_scan.return_value = []
 
@@ -253,9 +304,8 @@ class TestPruneAll:
     @patch("prime_uve.cli.prune.Cache")
     def test_prune_all_empty_cache(self, mock_cache_class, runner):
         """Test prune --all with empty cache."""
-        mock_cache = Mock()
-        mock_cache.list_all.return_value = {}
-        mock_cache_class.return_value = mock_cache
+        fake_cache = FakeCache()
+        mock_cache_class.return_value = fake_cache
 
         result = runner.invoke(cli, ["prune", "--all", "--yes"])
 
@@ -266,51 +316,54 @@ class TestPruneAll:
     @patch("prime_uve.cli.prune.expand_path_variables")
     @patch("prime_uve.cli.prune.get_disk_usage")
     def test_prune_all_with_venvs(
-        self, mock_disk_usage, mock_expand, mock_cache_class, runner, tmp_path
+        self, mock_disk_usage, mock_expand, mock_cache_class, tmp_path, capsys
     ):
         """Test prune --all with venvs."""
         # Setup mocks
         venv1 = tmp_path / "venv1"
         venv1.mkdir()
 
-        mock_cache = Mock()
-        mock_cache.list_all.return_value = {
-            str(tmp_path / "project1"): {
-                "venv_path": "${HOME}/venvs/project1",
-                "project_name": "project1",
-                "path_hash": "abc123",
-                "created_at": "2025-12-01T10:00:00Z",
+        fake_cache = FakeCache(
+            {
+                str(tmp_path / "project1"): {
+                    "venv_path": "${HOME}/venvs/project1",
+                    "project_name": "project1",
+                    "path_hash": "abc123",
+                    "created_at": "2025-12-01T10:00:00Z",
+                }
             }
-        }
-        mock_cache_class.return_value = mock_cache
+        )
+        mock_cache_class.return_value = fake_cache
         mock_expand.return_value = venv1
         mock_disk_usage.return_value = 1024
 
-        result = runner.invoke(cli, ["prune", "--all", "--yes"])
+        # Business logic only; CLI parsing is covered by TestPruneCommand
+        prune_all(None, verbose=False, yes=True, dry_run=False, json_output=False)
 
-        assert result.exit_code == 0
-        mock_cache.clear.assert_called_once()
+        assert "Removed 1 venv(s)" in capsys.readouterr().out
+        assert fake_cache.clear_calls == 1
         assert not venv1.exists()  # Should be removed
 
     @patch("prime_uve.cli.prune.Cache")
     def test_prune_all_user_abort(self, mock_cache_class, runner, tmp_path):
         """Test prune --all when user aborts."""
-        mock_cache = Mock()
-        mock_cache.list_all.return_value = {
-            str(tmp_path / "project1"): {
-                "venv_path": "${HOME}/venvs/project1",
-                "project_name": "project1",
-                "path_hash": "abc123",
-                "created_at": "2025-12-01T10:00:00Z",
+        fake_cache = FakeCache(
+            {
+                str(tmp_path / "project1"): {
+                    "venv_path": "${HOME}/venvs/project1",
+                    "project_name": "project1",
+                    "path_hash": "abc123",
+                    "created_at": "2025-12-01T10:00:00Z",
+                }
             }
-        }
-        mock_cache_class.return_value = mock_cache
+        )
+        mock_cache_class.return_value = fake_cache
 
         result = runner.invoke(cli, ["prune", "--all"], input="n\n")
 
         assert result.exit_code == 0
         assert "Aborted" in result.output
-        mock_cache.clear.assert_not_called()
+        assert fake_cache.clear_calls == 0
 
 
 class TestPruneOrphan:
@@ -329,16 +382,17 @@ class TestPruneOrphan:
         env_file = project_path / ".env.uve"
         env_file.write_text(f"UV_PROJECT_ENVIRONMENT={venv_path}\n")
 
-        mock_cache = Mock()
-        mock_cache.list_all.return_value = {
-            str(project_path): {
-                "venv_path": venv_path,
-                "project_name": "project1",
-                "path_hash": "abc123",
-                "created_at": "2025-12-01T10:00:00Z",
+        fake_cache = FakeCache(
+            {
+                str(project_path): {
+                    "venv_path": venv_path,
+                    "project_name": "project1",
+                    "path_hash": "abc123",
+                    "created_at": "2025-12-01T10:00:00Z",
+                }
             }
-        }
-        mock_cache_class.return_value = mock_cache
+        )
+        mock_cache_class.return_value = fake_cache
         # Mock scan to return no untracked venvs
         mock_scan.return_value = []
 
@@ -357,8 +411,8 @@ class TestPruneOrphan:
         mock_expand,
         mock_cache_class,
         mock_scan,
-        runner,
         tmp_path,
+        capsys,
     ):
         """Test prune --orphan with orphaned venvs."""
         project_path = tmp_path / "project1"
@@ -371,26 +425,26 @@ class TestPruneOrphan:
         venv1 = tmp_path / "venv1"
         venv1.mkdir()
 
-        mock_cache = Mock()
-        mock_cache.list_all.return_value = {
-            str(project_path): {
-                "venv_path": "${HOME}/venvs/project1",
-                "project_name": "project1",
-                "path_hash": "abc123",
-                "created_at": "2025-12-01T10:00:00Z",
+        fake_cache = FakeCache(
+            {
+                str(project_path): {
+                    "venv_path": "${HOME}/venvs/project1",
+                    "project_name": "project1",
+                    "path_hash": "abc123",
+                    "created_at": "2025-12-01T10:00:00Z",
+                }
             }
-        }
-        mock_cache_class.return_value = mock_cache
+        )
+        mock_cache_class.return_value = fake_cache
         mock_expand.return_value = venv1
         mock_disk_usage.return_value = 1024
         # Mock scan to return no untracked venvs
         mock_scan.return_value = []
 
-        result = runner.invoke(cli, ["prune", "--orphan", "--yes"])
+        prune_orphan(None, verbose=False, yes=True, dry_run=False, json_output=False)
 
-        assert result.exit_code == 0
-        assert "orphaned venv(s)" in result.output
-        mock_cache.remove_mapping.assert_called_once()
+        assert "orphaned venv(s)" in capsys.readouterr().out
+        assert fake_cache.remove_mappings_calls == [[project_path]]
 
 
 class TestPruneCurrent:
@@ -413,9 +467,8 @@ class TestPruneCurrent:
     ):
         """Test prune --current when project not managed."""
         mock_find_root.return_value = tmp_path
-        mock_cache = Mock()
-        mock_cache.get_mapping.return_value = None
-        mock_cache_class.return_value = mock_cache
+        fake_cache = FakeCache()
+        mock_cache_class.return_value = fake_cache
 
         result = runner.invoke(cli, ["prune", "--current"])
 
@@ -450,13 +503,16 @@ class TestPruneCurrent:
         env_file.write_text("UV_PROJECT_ENVIRONMENT=${HOME}/venv\n")
 
         mock_find_root.return_value = project_root
-        mock_cache = Mock()
-        mock_cache.get_mapping.return_value = {
-            "venv_path": "${HOME}/venv",
-            "project_name": "test-project",
-            "path_hash": "abc123",
-        }
-        mock_cache_class.return_value = mock_cache
+        fake_cache = FakeCache(
+            {
+                str(project_root): {
+                    "venv_path": "${HOME}/venv",
+                    "project_name": "test-project",
+                    "path_hash": "abc123",
+                }
+            }
+        )
+        mock_cache_class.return_value = fake_cache
         mock_expand.return_value = venv_dir
         mock_disk_usage.return_value = 1024
 
@@ -471,11 +527,58 @@ class TestPruneCurrent:
             os.chdir(original_cwd)
 
         assert result.exit_code == 0
-        mock_cache.remove_mapping.assert_called_once_with(project_root)
+        assert fake_cache.remove_mapping_calls == [project_root]
         assert not venv_dir.exists()
         # Check that .env.uve was cleared
         assert env_file.read_text().strip() == ""
 
+    @patch("prime_uve.cli.prune.find_project_root")
+    @patch("prime_uve.cli.prune.Cache")
+    @patch("prime_uve.cli.prune.expand_path_variables")
+    @patch("prime_uve.cli.prune.get_disk_usage")
+    def test_prune_current_clears_env_file_found_from_cwd(
+        self,
+        mock_disk_usage,
+        mock_expand,
+        mock_cache_class,
+        mock_find_root,
+        runner,
+        tmp_path,
+        monkeypatch,
+    ):
+        """Clears the .env.uve uve uses from the cwd, not the one at the root."""
+        project_root = tmp_path / "project"
+        subdir = project_root / "sub"
+        subdir.mkdir(parents=True)
+        venv_dir = tmp_path / "venv"
+        venv_dir.mkdir()
+
+        (project_root / "pyproject.toml").write_text("[project]\nname = 'p'\n")
+        root_env = project_root / ".env.uve"
+        root_env.write_text("UV_PROJECT_ENVIRONMENT=${HOME}/root-venv\n")
+        sub_env = subdir / ".env.uve"
+        sub_env.write_text("UV_PROJECT_ENVIRONMENT=${HOME}/venv\n")
+
+        mock_find_root.return_value = project_root
+        mock_cache_class.return_value = FakeCache(
+            {
+                str(project_root): {
+                    "venv_path": "${HOME}/venv",
+                    "project_name": "p",
+                    "path_hash": "abc123",
+                }
+            }
+        )
+        mock_expand.return_value = venv_dir
+        mock_disk_usage.return_value = 1024
+
+        monkeypatch.chdir(subdir)
+        result = runner.invoke(cli, ["prune", "--current", "--yes"])
+
+        assert result.exit_code == 0
+        assert sub_env.read_text() == ""
+        assert root_env.read_text() == "UV_PROJECT_ENVIRONMENT=${HOME}/root-venv\n"
+
 
 class TestPrunePath:
     """Tests for prune_path function."""
@@ -519,9 +622,8 @@ class TestPrunePath:
 
         mock_get_base.return_value = venv_base
         mock_disk_usage.return_value = 1024
-        mock_cache = Mock()
-        mock_cache.list_all.return_value = {}
-        mock_cache_class.return_value = mock_cache
+        fake_cache = FakeCache()
+        mock_cache_class.return_value = fake_cache
 
         result = runner.invoke(cli, ["prune", str(venv_dir), "--yes"])
 
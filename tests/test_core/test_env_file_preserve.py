@@ -187,3 +187,40 @@ DEBUG=true
     # Should be at the end
     lines = content.splitlines()
     assert lines[-1] == "UV_PROJECT_ENVIRONMENT=${HOME}/venvs/proj_abc"
+
+
+def test_preserve_format_skips_commented_out_assignment(tmp_path):
+    """Test that a commented-out assignment of an updated key is left alone."""
+    env_file = tmp_path / ".env.uve"
+    env_file.write_text("# KEY=old\n  KEY = current  \n")
+
+    update_env_file_preserve_format(env_file, {"KEY": "new"})
+
+    assert env_file.read_text().splitlines() == ["# KEY=old", "KEY=new"]
+
+
+def test_preserve_format_skips_noop_write(tmp_path, monkeypatch):
+    """Test that an update matching the file exactly does not rewrite it."""
+    env_file = tmp_path / ".env.uve"
+    env_file.write_text("# comment\nKEY=value")
+
+    def fail_write(path, content):
+        raise AssertionError("no-op update rewrote the file")
+
+    monkeypatch.setattr("prime_uve.core.env_file._atomic_write", fail_write)
+
+    update_env_file_preserve_format(env_file, {"KEY": "value"})
+
+    assert env_file.read_text() == "# comment\nKEY=value"
+
+
+def test_preserve_format_appends_new_keys_in_place(tmp_path):
+    """Test that adding only new keys appends to the existing file."""
+    env_file = tmp_path / ".env.uve"
+    env_file.write_text("# comment\nOTHER=1")
+    inode = env_file.stat().st_ino
+
+    update_env_file_preserve_format(env_file, {"KEY": "value"})
+
+    assert env_file.read_text() == "# comment\nOTHER=1\nKEY=value\n"
+    assert env_file.stat().st_ino == inode
@@ -1,10 +1,13 @@
 """Tests for .env.uve file management."""
 
+import os
 import sys
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
 
+import prime_uve.core.env_file as env_file_module
 from prime_uve.core.env_file import (
     EnvFileError,
     find_env_file,
@@ -253,6 +256,86 @@ def test_read_env_file_empty_file(tmp_path):
     assert result == {}
 
 
+def test_read_env_file_reuses_parse_of_unchanged_file(tmp_path, monkeypatch):
+    """Unchanged file is served from the cache; a rewrite is picked up."""
+    env_file = tmp_path / ".env.uve"
+    env_file.write_text("KEY=value\n")
+    old_ns = 1_000_000_000_000_000_000
+    os.utime(env_file, ns=(old_ns, old_ns))
+
+    first = read_env_file(env_file)
+    first["KEY"] = "mutated"
+
+    def fail_read_text(path):
+        raise AssertionError("cached file was re-read")
+
+    with monkeypatch.context() as m:
+        m.setattr(env_file_module, "_read_text", fail_read_text)
+        assert read_env_file(env_file) == {"KEY": "value"}
+
+    write_env_file(env_file, {"KEY": "other"})
+    assert read_env_file(env_file) == {"KEY": "other"}
+
+
+def test_read_env_file_detects_replaced_file(tmp_path):
+    """A file swapped in with the same mtime and size is re-read."""
+    env_file = tmp_path / ".env.uve"
+    replacement = tmp_path / "replacement.env"
+    old_ns = 1_000_000_000_000_000_000
+    env_file.write_text("KEY=old\n")
+    replacement.write_text("KEY=new\n")
+    os.utime(env_file, ns=(old_ns, old_ns))
+    os.utime(replacement, ns=(old_ns, old_ns))
+
+    assert read_env_file(env_file) == {"KEY": "old"}
+    os.replace(replacement, env_file)
+    assert read_env_file(env_file) == {"KEY": "new"}
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="Permission tests unreliable on Windows"
+)
+def test_read_env_file_rereads_after_chmod(tmp_path, monkeypatch):
+    """A cached file made unreadable reports the error instead of the cache."""
+    env_file = tmp_path / ".env.uve"
+    env_file.write_text("KEY=value\n")
+    old_ns = 1_000_000_000_000_000_000
+    os.utime(env_file, ns=(old_ns, old_ns))
+    assert read_env_file(env_file) == {"KEY": "value"}
+
+    def denied_read_text(path):
+        raise PermissionError("denied")
+
+    # chmod only changes ctime; the read is forced to fail because root
+    # could still open the file
+    env_file.chmod(0o000)
+    try:
+        with monkeypatch.context() as m:
+            m.setattr(env_file_module, "_read_text", denied_read_text)
+            with pytest.raises(EnvFileError, match="Permission denied"):
+                read_env_file(env_file)
+    finally:
+        env_file.chmod(0o644)
+
+
+def test_read_env_file_cache_is_bounded(tmp_path, monkeypatch):
+    """The parse cache evicts least recently used files."""
+    monkeypatch.setattr(env_file_module, "_ENV_CACHE_SIZE", 2)
+    monkeypatch.setattr(env_file_module, "_ENV_CACHE", OrderedDict())
+    old_ns = 1_000_000_000_000_000_000
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / name
+        path.write_text("KEY=value\n")
+        os.utime(path, ns=(old_ns, old_ns))
+        paths.append(path)
+
+    for path in paths:
+        read_env_file(path)
+
+    assert list(env_file_module._ENV_CACHE) == paths[1:]
+
+
 def test_read_env_file_missing_file(tmp_path):
     """Missing file raises EnvFileError."""
     env_file = tmp_path / "nonexistent.env"
@@ -330,6 +413,26 @@ def test_write_env_file_overwrites_existing(tmp_path):
     assert "OLD" not in content
 
 
+def test_write_env_file_keeps_symlink_and_mode(tmp_path):
+    """Writing through a symlink updates its target and keeps the file mode."""
+    actual_file = tmp_path / "actual.env"
+    actual_file.write_text("KEY=old\n")
+    actual_file.chmod(0o640)
+    env_file = tmp_path / ".env.uve"
+    try:
+        env_file.symlink_to(actual_file)
+    except OSError:
+        pytest.skip("Cannot create symlinks")
+
+    write_env_file(env_file, {"KEY": "new"})
+
+    assert env_file.is_symlink()
+    assert actual_file.read_text() == "KEY=new\n"
+    if sys.platform != "win32":
+        assert actual_file.stat().st_mode & 0o777 == 0o640
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".env.uve", "actual.env"]
+
+
 def test_write_env_file_creates_parent_dirs(tmp_path):
     """Creates parent directories if missing."""
     env_file = tmp_path / "subdir" / "nested" / ".env.uve"
@@ -368,6 +471,35 @@ def test_write_env_file_permission_denied(tmp_path):
         readonly_dir.chmod(0o755)
 
 
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="Permission tests unreliable on Windows"
+)
+def test_write_env_file_readonly_file(tmp_path, monkeypatch):
+    """A read-only file in a writable directory is not replaced."""
+    env_file = tmp_path / ".env.uve"
+    env_file.write_text("KEY=old\n")
+    env_file.chmod(0o444)
+
+    # root bypasses the mode bits, so report the file as read-only directly
+    real_access = os.access
+
+    def mock_access(path, mode, *args, **kwargs):
+        if os.fspath(path) == os.path.realpath(env_file) and mode & os.W_OK:
+            return False
+        return real_access(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr(os, "access", mock_access)
+
+    try:
+        with pytest.raises(EnvFileError, match="Permission denied"):
+            write_env_file(env_file, {"KEY": "new"})
+    finally:
+        env_file.chmod(0o644)
+
+    assert env_file.read_text() == "KEY=old\n"
+    assert list(tmp_path.iterdir()) == [env_file]
+
+
 # ============================================================================
 # Update Tests
 # ============================================================================
@@ -418,6 +550,21 @@ def test_update_env_file_preserves_order(tmp_path):
     assert lines == ["ALPHA=first", "MIDDLE=mid", "ZEBRA=last"]
 
 
+def test_update_env_file_skips_noop_write(tmp_path, monkeypatch):
+    """File is not rewritten when every update matches the current value."""
+    env_file = tmp_path / ".env.uve"
+    env_file.write_text("# keep me\nKEY=value\n")
+
+    def fail_write(path, content):
+        raise AssertionError("no-op update rewrote the file")
+
+    monkeypatch.setattr("prime_uve.core.env_file._atomic_write", fail_write)
+
+    update_env_file(env_file, {"KEY": "value"})
+
+    assert env_file.read_text() == "# keep me\nKEY=value\n"
+
+
 # ============================================================================
 # Get Venv Path Tests
 # ============================================================================
@@ -695,17 +842,11 @@ def test_get_venv_path_with_expanded_actual_path():
 
 def test_find_env_file_permission_error_on_create(tmp_path, monkeypatch):
     """Raises EnvFileError if cannot create .env.uve due to permissions."""
-    # Create a scenario where we can't create the file
-    # We'll mock Path.touch to raise PermissionError
 
-    original_touch = Path.touch
+    def mock_create_empty(path):
+        raise PermissionError("Mocked permission error")
 
-    def mock_touch(self, *args, **kwargs):
-        if self.name == ".env.uve":
-            raise PermissionError("Mocked permission error")
-        return original_touch(self, *args, **kwargs)
-
-    monkeypatch.setattr(Path, "touch", mock_touch)
+    monkeypatch.setattr(env_file_module, "_create_empty", mock_create_empty)
 
     with pytest.raises(EnvFileError, match="Cannot create .env.uve"):
         find_env_file(tmp_path)
@@ -716,15 +857,11 @@ def test_read_env_file_oserror(tmp_path, monkeypatch):
     env_file = tmp_path / ".env.uve"
     env_file.touch()
 
-    # Mock read_text to raise OSError
-    original_read_text = Path.read_text
-
-    def mock_read_text(self, *args, **kwargs):
-        if self.name == ".env.uve":
-            raise OSError("Mocked OS error")
-        return original_read_text(self, *args, **kwargs)
+    # Mock the module's file read to raise OSError
+    def mock_read_text(path):
+        raise OSError("Mocked OS error")
 
-    monkeypatch.setattr(Path, "read_text", mock_read_text)
+    monkeypatch.setattr(env_file_module, "_read_text", mock_read_text)
 
     with pytest.raises(EnvFileError, match="Cannot read file"):
         read_env_file(env_file)
@@ -735,15 +872,11 @@ def test_read_env_file_permission_error_mocked(tmp_path, monkeypatch):
     env_file = tmp_path / ".env.uve"
     env_file.touch()
 
-    # Mock read_text to raise PermissionError
-    original_read_text = Path.read_text
-
-    def mock_read_text(self, *args, **kwargs):
-        if self.name == ".env.uve":
-            raise PermissionError("Mocked permission error")
-        return original_read_text(self, *args, **kwargs)
+    # Mock the module's file read to raise PermissionError
+    def mock_read_text(path):
+        raise PermissionError("Mocked permission error")
 
-    monkeypatch.setattr(Path, "read_text", mock_read_text)
+    monkeypatch.setattr(env_file_module, "_read_text", mock_read_text)
 
     with pytest.raises(EnvFileError, match="Permission denied"):
         read_env_file(env_file)
@@ -771,33 +904,28 @@ def test_write_env_file_oserror(tmp_path, monkeypatch):
     """Raises EnvFileError for generic OSError during write."""
     env_file = tmp_path / ".env.uve"
 
-    # Mock write_text to raise OSError
-    original_write_text = Path.write_text
+    # Mock the rename of the temporary file to raise OSError
+    def mock_replace(src, dst):
+        raise OSError("Mocked OS error")
 
-    def mock_write_text(self, *args, **kwargs):
-        if self.name == ".env.uve":
-            raise OSError("Mocked OS error")
-        return original_write_text(self, *args, **kwargs)
-
-    monkeypatch.setattr(Path, "write_text", mock_write_text)
+    monkeypatch.setattr(os, "replace", mock_replace)
 
     with pytest.raises(EnvFileError, match="Cannot write file"):
         write_env_file(env_file, {"KEY": "value"})
 
+    # The temporary file is cleaned up
+    assert list(tmp_path.iterdir()) == []
+
 
 def test_write_env_file_permission_error_mocked(tmp_path, monkeypatch):
     """Raises EnvFileError for PermissionError during write."""
     env_file = tmp_path / ".env.uve"
 
-    # Mock write_text to raise PermissionError
-    original_write_text = Path.write_text
-
-    def mock_write_text(self, *args, **kwargs):
-        if self.name == ".env.uve":
-            raise PermissionError("Mocked permission error")
-        return original_write_text(self, *args, **kwargs)
+    # Mock the rename of the temporary file to raise PermissionError
+    def mock_replace(src, dst):
+        raise PermissionError("Mocked permission error")
 
-    monkeypatch.setattr(Path, "write_text", mock_write_text)
+    monkeypatch.setattr(os, "replace", mock_replace)
 
     with pytest.raises(EnvFileError, match="Permission denied"):
         write_env_file(env_file, {"KEY": "value"})
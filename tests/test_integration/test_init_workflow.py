@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pytest
 from click.testing import CliRunner
 
+from prime_uve.cli.init import init_command
 from prime_uve.cli.main import cli
 from prime_uve.core.cache import Cache
 from prime_uve.core.env_file import read_env_file
@@ -47,6 +48,19 @@ def cache_file(tmp_path):
     return cache_file
 
 
+def run_init(force: bool = False, yes: bool = False) -> None:
+    """Run the init command logic directly, bypassing Click's argv parsing."""
+    init_command(
+        None,
+        force=force,
+        venv_dir=None,
+        verbose=False,
+        yes=yes,
+        dry_run=False,
+        json_output=False,
+    )
+
+
 def test_init_then_uve_sync(runner, test_project, cache_file, monkeypatch):
     """Test that uve sync works after init (venv created by uv)."""
     monkeypatch.chdir(test_project)
@@ -70,7 +84,7 @@ def test_init_then_uve_sync(runner, test_project, cache_file, monkeypatch):
         assert "${HOME}" in venv_path or "$HOME" in venv_path
 
 
-def test_init_then_list(runner, test_project, cache_file, monkeypatch):
+def test_init_then_list(test_project, cache_file, monkeypatch):
     """Test that init + list shows correct entry."""
     monkeypatch.chdir(test_project)
 
@@ -78,8 +92,7 @@ def test_init_then_list(runner, test_project, cache_file, monkeypatch):
         "prime_uve.core.cache.Cache._default_cache_path", return_value=cache_file
     ):
         # Run init
-        result = runner.invoke(cli, ["init"])
-        assert result.exit_code == 0
+        run_init()
 
         # Verify cache entry exists
         cache = Cache(cache_path=cache_file)
@@ -95,7 +108,7 @@ def test_init_then_list(runner, test_project, cache_file, monkeypatch):
         assert entry["project_name"] == "integration-test"
 
 
-def test_init_force_workflow(runner, test_project, cache_file, monkeypatch):
+def test_init_force_workflow(test_project, cache_file, monkeypatch):
     """Test force reinitialization workflow."""
     monkeypatch.chdir(test_project)
 
@@ -103,20 +116,18 @@ def test_init_force_workflow(runner, test_project, cache_file, monkeypatch):
         "prime_uve.core.cache.Cache._default_cache_path", return_value=cache_file
     ):
         # First init
-        result1 = runner.invoke(cli, ["init"])
-        assert result1.exit_code == 0
+        run_init()
 
         # Read first venv path
         env_vars1 = read_env_file(test_project / ".env.uve")
         venv_path1 = env_vars1["UV_PROJECT_ENVIRONMENT"]
 
         # Try init without force - should fail
-        result2 = runner.invoke(cli, ["init"])
-        assert result2.exit_code == 1
+        with pytest.raises(ValueError, match="already initialized"):
+            run_init()
 
         # Force reinit with --yes
-        result3 = runner.invoke(cli, ["init", "--force", "--yes"])
-        assert result3.exit_code == 0
+        run_init(force=True, yes=True)
 
         # Read second venv path - should be same (same project path)
         env_vars2 = read_env_file(test_project / ".env.uve")
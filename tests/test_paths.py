@@ -1,5 +1,6 @@
 """Tests for prime_uve.core.paths module."""
 
+import hashlib
 import os
 import sys
 from pathlib import Path
@@ -12,7 +13,9 @@ from prime_uve.core.paths import (
     generate_hash,
     generate_venv_path,
     get_project_name,
+    get_venv_base_dir,
     ensure_home_set,
+    load_pyproject,
 )
 
 
@@ -54,6 +57,23 @@ class TestGenerateHash:
         assert len(hash_from_path) == 8
         assert hash_from_path.isalnum()
 
+    def test_matches_resolved_posix_path(self, tmp_path):
+        """Hash is SHA256 of the resolved POSIX path, symlinks included."""
+        project_path = tmp_path / "my-project"
+        project_path.mkdir()
+        link = tmp_path / "link"
+        try:
+            link.symlink_to(project_path, target_is_directory=True)
+        except OSError:
+            pytest.skip("Symlinks not supported")
+
+        expected = hashlib.sha256(
+            project_path.resolve().as_posix().encode()
+        ).hexdigest()[:8]
+
+        assert generate_hash(project_path) == expected
+        assert generate_hash(link) == expected
+
     def test_long_path(self, tmp_path):
         """Handles very long paths."""
         long_path = tmp_path / ("a" * 100) / ("b" * 100) / ("c" * 100)
@@ -146,6 +166,15 @@ class TestGetProjectName:
 
         assert not name.endswith("-")
 
+    def test_sanitization_leading_and_unicode(self, tmp_path):
+        """Drops leading separators and keeps unicode letters."""
+        project_path = tmp_path / "__Café_Ünïcode"
+        project_path.mkdir()
+
+        name = get_project_name(project_path)
+
+        assert name == "café-ünïcode"
+
     def test_empty_after_sanitization(self, tmp_path):
         """Returns 'project' if name becomes empty after sanitization."""
         project_path = tmp_path / "!!!"
@@ -286,6 +315,49 @@ class TestExpandPathVariables:
 
         assert isinstance(expanded, Path)
 
+    @patch.dict(os.environ, {"HOME": "/env/home"})
+    def test_uses_pre_resolved_home(self):
+        """An explicit home argument takes precedence over the environment."""
+        expanded = expand_path_variables("${HOME}/prime-uve", home="/given/home")
+
+        assert expanded == Path("/given/home/prime-uve")
+
+    def test_literal_path_skips_home_lookup(self):
+        """A path without ${HOME} is returned without resolving the home dir."""
+        with patch("prime_uve.core.paths.get_home_dir", side_effect=AssertionError):
+            expanded = expand_path_variables("/opt/venvs/myproject")
+
+        assert expanded == Path("/opt/venvs/myproject")
+
+
+class TestGetVenvBaseDir:
+    """Tests for get_venv_base_dir function."""
+
+    def test_follows_home_changes(self):
+        """Memoized base dir still tracks the current HOME."""
+        if sys.platform == "win32":
+            pytest.skip("Unix-specific test")
+
+        with patch.dict(os.environ, {"HOME": "/first/home"}):
+            assert get_venv_base_dir() == Path("/first/home/prime-uve/venvs")
+        with patch.dict(os.environ, {"HOME": "/second/home"}):
+            assert get_venv_base_dir() == Path("/second/home/prime-uve/venvs")
+
+
+class TestLoadPyproject:
+    """Tests for load_pyproject function."""
+
+    def test_parses_file(self, tmp_path):
+        """Returns the parsed TOML document."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "loaded"\n')
+
+        assert load_pyproject(pyproject) == {"project": {"name": "loaded"}}
+
+    def test_missing_file(self, tmp_path):
+        """Returns None when the file does not exist."""
+        assert load_pyproject(tmp_path / "pyproject.toml") is None
+
 
 class TestEnsureHomeSet:
     """Tests for ensure_home_set function."""
@@ -1,7 +1,10 @@
 """Tests for project detection and metadata extraction."""
 
+import dataclasses
+import os
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -374,6 +377,48 @@ def test_metadata_matches_paths_module(tmp_path):
     assert metadata.name == name_from_paths
 
 
+def test_pyproject_parsed_once_for_name_and_metadata(tmp_path):
+    """An unchanged pyproject.toml is parsed once across paths and project."""
+    from prime_uve.core import paths
+    from prime_uve.core.paths import get_project_name
+
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "cached-project"')
+    # Age the file past the racy window so its parse may be cached
+    old = pyproject.stat().st_mtime - 10
+    os.utime(pyproject, (old, old))
+
+    with patch.object(paths.tomllib, "loads", wraps=paths.tomllib.loads) as loads:
+        assert get_project_name(tmp_path) == "cached-project"
+        assert get_project_metadata(tmp_path).name == "cached-project"
+
+        # Changing the file invalidates the cached parse
+        pyproject.write_text('[project]\nname = "renamed-project"')
+        os.utime(pyproject, (old, old))
+        assert get_project_name(tmp_path) == "renamed-project"
+
+    assert loads.call_count == 2
+
+
+def test_metadata_stats_pyproject_once(tmp_path):
+    """get_project_metadata stats pyproject.toml once for presence and parse."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "stat-once"')
+    real_stat = os.stat
+    pyproject_stats = []
+
+    def counting_stat(path, *args, **kwargs):
+        if os.fspath(path).endswith("pyproject.toml"):
+            pyproject_stats.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    with patch("os.stat", side_effect=counting_stat):
+        metadata = get_project_metadata(tmp_path)
+
+    assert metadata.name == "stat-once"
+    assert metadata.has_pyproject is True
+    assert len(pyproject_stats) == 1
+
+
 # ===========================
 # Edge Cases
 # ===========================
@@ -484,6 +529,23 @@ def test_project_metadata_dataclass_properties():
     assert metadata_no_pyproject.is_valid_python_project is False
 
 
+def test_project_metadata_is_frozen():
+    """ProjectMetadata is immutable and hashable."""
+    metadata = ProjectMetadata(
+        name="frozen-project",
+        path=Path("/tmp/test"),
+        has_pyproject=True,
+        python_version=None,
+        description=None,
+    )
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        metadata.name = "other"
+
+    assert not hasattr(metadata, "__dict__")
+    assert {metadata: 1}[metadata] == 1
+
+
 def test_project_name_with_leading_trailing_spaces(tmp_path):
     """Handles project names with leading/trailing spaces."""
     pyproject = tmp_path / "pyproject.toml"
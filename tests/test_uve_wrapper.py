@@ -1,7 +1,10 @@
 """Tests for uve wrapper."""
 
 import os
-from unittest.mock import MagicMock, patch
+import shutil
+import subprocess
+import sys
+from unittest.mock import patch
 
 import pytest
 
@@ -13,12 +16,12 @@ from prime_uve.uve.wrapper import is_uv_available, main
 
 @pytest.fixture
 def mock_env_file(tmp_path):
-    """Create a mock .env.uve file."""
-    env_file = tmp_path / ".env.uve"
-    env_file.write_text(
-        "UV_PROJECT_ENVIRONMENT=${HOME}/prime-uve/venvs/test_12345678\n"
-    )
-    return env_file
+    """Path of a mock .env.uve file.
+
+    Not created on disk: main() only forwards the path to uv and never
+    opens it. Tests that care about file contents write their own.
+    """
+    return tmp_path / ".env.uve"
 
 
 @pytest.fixture
@@ -35,383 +38,278 @@ def mock_subprocess():
     """Mock subprocess.run."""
     with patch("prime_uve.uve.wrapper.subprocess.run") as mock_run:
         # Default: return success
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0)
         yield mock_run
 
 
-@pytest.fixture
-def mock_is_uv_available():
-    """Mock is_uv_available to return True."""
-    with patch("prime_uve.uve.wrapper.is_uv_available", return_value=True):
-        yield
+@pytest.fixture(autouse=True)
+def uv_on_path(monkeypatch):
+    """Make uv look installed; tests that need it missing override shutil.which."""
+    monkeypatch.setattr(shutil, "which", lambda cmd: "/usr/bin/uv")
 
 
-# Tests for is_uv_available()
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Start from an empty os.environ; tests add variables with monkeypatch."""
+    for key in list(os.environ):
+        monkeypatch.delenv(key)
 
 
-def test_is_uv_available_true():
-    """Detects when uv is available."""
-    with patch("shutil.which", return_value="/usr/bin/uv"):
-        assert is_uv_available() is True
+def expected_env_file_arg(env_file):
+    """The --env-file argument uve builds: POSIX path with escaped spaces."""
+    return env_file.as_posix().replace(" ", r"\ ")
 
 
-def test_is_uv_available_false():
-    """Detects when uv is not available."""
-    with patch("shutil.which", return_value=None):
-        assert is_uv_available() is False
+def run_uve(monkeypatch, *args):
+    """Run main() as `uve <args>` and return its exit code."""
+    monkeypatch.setattr(sys, "argv", ["uve", *args])
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    return exc_info.value.code
 
 
-# Tests for main() - Basic Functionality
+# Tests for is_uv_available()
 
 
-def test_main_finds_env_file(mock_find_env_file, mock_subprocess, mock_is_uv_available):
-    """uve finds .env.uve in current directory."""
-    with patch("sys.argv", ["uve", "sync"]), pytest.raises(SystemExit) as exc_info:
-        main()
+def test_is_uv_available_true():
+    """Detects when uv is available."""
+    # uv_on_path (autouse) makes shutil.which find uv
+    assert is_uv_available() is True
 
-    assert exc_info.value.code == 0
-    # Verify subprocess was called with env file (POSIX format with escaped spaces)
-    mock_subprocess.assert_called_once()
-    cmd = mock_subprocess.call_args[0][0]
-    expected_path = mock_find_env_file.as_posix().replace(" ", r"\ ")
-    assert expected_path in cmd
 
+def test_is_uv_available_false(monkeypatch):
+    """Detects when uv is not available."""
+    monkeypatch.setattr(shutil, "which", lambda cmd: None)
+    assert is_uv_available() is False
 
-def test_main_passes_args_to_uv(
-    mock_find_env_file, mock_subprocess, mock_is_uv_available
-):
-    """Arguments are passed through to uv."""
-    with (
-        patch("sys.argv", ["uve", "add", "requests", "--dev"]),
-        pytest.raises(SystemExit) as exc_info,
-    ):
-        main()
 
-    assert exc_info.value.code == 0
-    cmd = mock_subprocess.call_args[0][0]
-    assert "add" in cmd
-    assert "requests" in cmd
-    assert "--dev" in cmd
+# Tests for main() - Basic Functionality
 
 
-def test_main_forwards_exit_code(
-    mock_find_env_file, mock_subprocess, mock_is_uv_available
-):
+def test_main_forwards_exit_code(mock_find_env_file, mock_subprocess, monkeypatch):
     """Exit code from uv is forwarded."""
     # Mock uv returning exit code 42
-    mock_result = MagicMock()
-    mock_result.returncode = 42
-    mock_subprocess.return_value = mock_result
-
-    with patch("sys.argv", ["uve", "sync"]), pytest.raises(SystemExit) as exc_info:
-        main()
+    mock_subprocess.return_value = subprocess.CompletedProcess(args=[], returncode=42)
 
-    assert exc_info.value.code == 42
+    exit_code = run_uve(monkeypatch, "sync")
 
-
-def test_main_with_no_args(mock_find_env_file, mock_subprocess, mock_is_uv_available):
-    """Works with no arguments (uve → uv run --env-file .env.uve -- uv)."""
-    with patch("sys.argv", ["uve"]), pytest.raises(SystemExit) as exc_info:
-        main()
-
-    assert exc_info.value.code == 0
-    cmd = mock_subprocess.call_args[0][0]
-    # Should be: uv run --env-file <path> -- uv
-    assert cmd[:2] == ["uv", "run"]
-    assert "--env-file" in cmd
-    assert "--" in cmd
-    assert cmd[cmd.index("--") + 1] == "uv"
+    assert exit_code == 42
 
 
 # Tests for Command Construction
 
 
-def test_main_constructs_correct_command(
-    mock_find_env_file, mock_subprocess, mock_is_uv_available
-):
-    """Verify exact command: uv run --env-file .env.uve -- uv [args]."""
-    with patch("sys.argv", ["uve", "add", "requests"]), pytest.raises(SystemExit):
-        main()
-
-    cmd = mock_subprocess.call_args[0][0]
-    expected_path = mock_find_env_file.as_posix().replace(" ", r"\ ")
-    expected_prefix = [
-        "uv",
-        "run",
-        "--env-file",
-        expected_path,
-        "--",
-        "uv",
-    ]
-    assert cmd[: len(expected_prefix)] == expected_prefix
-    assert cmd[len(expected_prefix) :] == ["add", "requests"]
-
-
-def test_main_with_multiple_args(
-    mock_find_env_file, mock_subprocess, mock_is_uv_available
+@pytest.mark.parametrize(
+    "args",
+    [
+        pytest.param(["sync"], id="single-command"),
+        pytest.param([], id="no-args"),
+        pytest.param(["add", "requests"], id="command-with-arg"),
+        pytest.param(["add", "requests", "--dev"], id="trailing-flag"),
+        pytest.param(["--verbose", "sync"], id="leading-flag"),
+        pytest.param(["run", "python", "-c", "print('hello')"], id="many-args"),
+    ],
+)
+def test_main_constructs_command(
+    mock_find_env_file, mock_subprocess, monkeypatch, args
 ):
-    """Works with multiple arguments."""
-    with (
-        patch("sys.argv", ["uve", "run", "python", "-c", "print('hello')"]),
-        pytest.raises(SystemExit),
-    ):
-        main()
-
-    cmd = mock_subprocess.call_args[0][0]
-    assert "run" in cmd
-    assert "python" in cmd
-    assert "-c" in cmd
-    assert "print('hello')" in cmd
-
-
-def test_main_with_flags(mock_find_env_file, mock_subprocess, mock_is_uv_available):
-    """Preserves flags like --verbose."""
-    with patch("sys.argv", ["uve", "--verbose", "sync"]), pytest.raises(SystemExit):
-        main()
+    """Runs exactly: uv run --env-file <.env.uve> -- uv [args]."""
+    exit_code = run_uve(monkeypatch, *args)
 
+    assert exit_code == 0
+    mock_subprocess.assert_called_once()
     cmd = mock_subprocess.call_args[0][0]
-    assert "--verbose" in cmd
+    expected_path = expected_env_file_arg(mock_find_env_file)
+    assert cmd == ["uv", "run", "--env-file", expected_path, "--", "uv", *args]
 
 
 # Tests for Environment Variables
 
 
-def test_main_sets_home_on_windows(
-    mock_find_env_file, mock_subprocess, mock_is_uv_available
-):
-    """On Windows, HOME is set if missing."""
-    with (
-        patch("sys.platform", "win32"),
-        patch.dict(os.environ, {"USERPROFILE": "C:\\Users\\test"}, clear=True),
-        patch("sys.argv", ["uve", "sync"]),
-        pytest.raises(SystemExit),
-    ):
-        main()
-
-    # Check that env passed to subprocess has HOME set
-    env = mock_subprocess.call_args[1]["env"]
-    assert env["HOME"] == "C:\\Users\\test"
-
-
-def test_main_preserves_existing_home(
-    mock_find_env_file, mock_subprocess, mock_is_uv_available
-):
-    """Existing HOME variable is not overridden."""
-    with (
-        patch("sys.platform", "win32"),
-        patch.dict(
-            os.environ, {"HOME": "/custom/home", "USERPROFILE": "C:\\Users\\test"}
+@pytest.mark.parametrize(
+    "platform,environ,expanduser,expected_home",
+    [
+        pytest.param(
+            "win32",
+            {"USERPROFILE": "C:\\Users\\test"},
+            None,
+            "C:\\Users\\test",
+            id="windows-home-from-userprofile",
         ),
-        patch("sys.argv", ["uve", "sync"]),
-        pytest.raises(SystemExit),
-    ):
-        main()
-
-    env = mock_subprocess.call_args[1]["env"]
-    assert env["HOME"] == "/custom/home"
-
-
-def test_main_windows_home_from_userprofile(
-    mock_find_env_file, mock_subprocess, mock_is_uv_available
-):
-    """On Windows, HOME set from USERPROFILE if missing."""
-    with (
-        patch("sys.platform", "win32"),
-        patch.dict(os.environ, {"USERPROFILE": "C:\\Users\\testuser"}, clear=True),
-        patch("sys.argv", ["uve", "sync"]),
-        pytest.raises(SystemExit),
-    ):
-        main()
-
-    env = mock_subprocess.call_args[1]["env"]
-    assert env["HOME"] == "C:\\Users\\testuser"
-
-
-def test_main_windows_home_fallback(
-    mock_find_env_file, mock_subprocess, mock_is_uv_available
+        pytest.param(
+            "win32",
+            {"HOME": "/custom/home", "USERPROFILE": "C:\\Users\\test"},
+            None,
+            "/custom/home",
+            id="windows-preserves-existing-home",
+        ),
+        pytest.param(
+            "win32",
+            {},
+            "C:\\Users\\fallback",
+            "C:\\Users\\fallback",
+            id="windows-expanduser-fallback",
+        ),
+        pytest.param(
+            "linux",
+            {"HOME": "/home/user"},
+            None,
+            "/home/user",
+            id="unix-home-untouched",
+        ),
+    ],
+)
+def test_main_home_in_subprocess_env(
+    mock_find_env_file,
+    mock_subprocess,
+    clean_env,
+    monkeypatch,
+    platform,
+    environ,
+    expanduser,
+    expected_home,
 ):
-    """On Windows, falls back to expanduser if USERPROFILE missing."""
-    with (
-        patch("sys.platform", "win32"),
-        patch.dict(os.environ, {}, clear=True),
-        patch("os.path.expanduser", return_value="C:\\Users\\fallback"),
-        patch("sys.argv", ["uve", "sync"]),
-        pytest.raises(SystemExit),
-    ):
-        main()
+    """HOME handed to uv: set on Windows if missing, otherwise left alone.
 
-    env = mock_subprocess.call_args[1]["env"]
-    assert env["HOME"] == "C:\\Users\\fallback"
+    expanduser is only consulted as the last resort; cases that do not
+    provide a fallback fail if it is called.
+    """
+    monkeypatch.setattr(sys, "platform", platform)
+    for key, value in environ.items():
+        monkeypatch.setenv(key, value)
 
+    if expanduser is None:
+        expanduser_patch = patch("os.path.expanduser", side_effect=AssertionError)
+    else:
+        expanduser_patch = patch("os.path.expanduser", return_value=expanduser)
 
-def test_main_unix_no_home_modification(
-    mock_find_env_file, mock_subprocess, mock_is_uv_available
-):
-    """On Unix, HOME is not modified."""
-    original_home = "/home/user"
-    with (
-        patch("sys.platform", "linux"),
-        patch.dict(os.environ, {"HOME": original_home}),
-        patch("sys.argv", ["uve", "sync"]),
-        pytest.raises(SystemExit),
-    ):
-        main()
+    with expanduser_patch:
+        run_uve(monkeypatch, "sync")
 
     env = mock_subprocess.call_args[1]["env"]
-    assert env["HOME"] == original_home
+    assert env["HOME"] == expected_home
 
 
 # Tests for Error Handling
 
 
-def test_main_uv_not_found(mock_find_env_file, mock_subprocess, capsys):
+def test_main_uv_not_found(mock_find_env_file, mock_subprocess, capsys, monkeypatch):
     """Clear error when uv not found."""
-    with (
-        patch("prime_uve.uve.wrapper.is_uv_available", return_value=False),
-        patch("sys.argv", ["uve", "sync"]),
-        pytest.raises(SystemExit) as exc_info,
-    ):
-        main()
+    monkeypatch.setattr(shutil, "which", lambda cmd: None)
+    exit_code = run_uve(monkeypatch, "sync")
 
-    assert exc_info.value.code == 1
+    assert exit_code == 1
     captured = capsys.readouterr()
     assert "uv' command not found" in captured.err
     assert "https://github.com/astral-sh/uv" in captured.err
 
 
-def test_main_env_file_not_found_error(capsys, mock_subprocess, mock_is_uv_available):
-    """Error when .env.uve cannot be found."""
-    with (
-        patch(
+@pytest.mark.parametrize(
+    "target,side_effect,expected_code,expected_err",
+    [
+        pytest.param(
             "prime_uve.uve.wrapper.find_env_file_strict",
-            side_effect=Exception(".env.uve not found in project"),
+            Exception(".env.uve not found in project"),
+            1,
+            ["Error:", ".env.uve not found in project"],
+            id="env-file-not-found",
         ),
-        patch("sys.argv", ["uve", "sync"]),
-        pytest.raises(SystemExit) as exc_info,
-    ):
-        main()
-
-    assert exc_info.value.code == 1
-    captured = capsys.readouterr()
-    assert "Error:" in captured.err
-    assert ".env.uve not found in project" in captured.err
-
-
-def test_main_subprocess_error(mock_find_env_file, capsys, mock_is_uv_available):
-    """Handles subprocess errors gracefully."""
-    with (
-        patch(
+        pytest.param(
             "prime_uve.uve.wrapper.subprocess.run",
-            side_effect=Exception("Subprocess error"),
+            Exception("Subprocess error"),
+            1,
+            ["Error running uv", "Subprocess error"],
+            id="subprocess-error",
         ),
-        patch("sys.argv", ["uve", "sync"]),
-        pytest.raises(SystemExit) as exc_info,
-    ):
-        main()
+        pytest.param(
+            "prime_uve.uve.wrapper.subprocess.run",
+            KeyboardInterrupt,
+            130,
+            [],
+            id="keyboard-interrupt",
+        ),
+    ],
+)
+def test_main_handles_errors(
+    mock_find_env_file,
+    mock_subprocess,
+    capsys,
+    monkeypatch,
+    target,
+    side_effect,
+    expected_code,
+    expected_err,
+):
+    """Failures finding .env.uve or running uv exit cleanly with a message."""
+    with patch(target, side_effect=side_effect):
+        exit_code = run_uve(monkeypatch, "sync")
 
-    assert exc_info.value.code == 1
+    assert exit_code == expected_code
     captured = capsys.readouterr()
-    assert "Error running uv" in captured.err
-    assert "Subprocess error" in captured.err
-
-
-def test_main_keyboard_interrupt(mock_find_env_file, mock_is_uv_available):
-    """Handles Ctrl+C (KeyboardInterrupt) gracefully."""
-    with (
-        patch("prime_uve.uve.wrapper.subprocess.run", side_effect=KeyboardInterrupt),
-        patch("sys.argv", ["uve", "sync"]),
-        pytest.raises(SystemExit) as exc_info,
-    ):
-        main()
-
-    assert exc_info.value.code == 130
+    for message in expected_err:
+        assert message in captured.err
 
 
-def test_main_uv_command_fails(
-    mock_find_env_file, mock_subprocess, mock_is_uv_available
-):
+def test_main_uv_command_fails(mock_find_env_file, mock_subprocess, monkeypatch):
     """Forwards non-zero exit code from uv."""
-    mock_result = MagicMock()
-    mock_result.returncode = 1
-    mock_subprocess.return_value = mock_result
+    mock_subprocess.return_value = subprocess.CompletedProcess(args=[], returncode=1)
 
-    with (
-        patch("sys.argv", ["uve", "add", "nonexistent"]),
-        pytest.raises(SystemExit) as exc_info,
-    ):
-        main()
+    exit_code = run_uve(monkeypatch, "add", "nonexistent")
 
-    assert exc_info.value.code == 1
+    assert exit_code == 1
 
 
 # Tests for Integration
 
 
-def test_main_with_empty_env_file(tmp_path, mock_subprocess, mock_is_uv_available):
+def test_main_with_empty_env_file(tmp_path, mock_subprocess, monkeypatch):
     """Works with empty .env.uve file."""
     env_file = tmp_path / ".env.uve"
     env_file.write_text("")  # Empty file
 
-    with (
-        patch("prime_uve.uve.wrapper.find_env_file_strict", return_value=env_file),
-        patch("sys.argv", ["uve", "sync"]),
-        pytest.raises(SystemExit) as exc_info,
-    ):
-        main()
+    with patch("prime_uve.uve.wrapper.find_env_file_strict", return_value=env_file):
+        exit_code = run_uve(monkeypatch, "sync")
 
-    assert exc_info.value.code == 0
+    assert exit_code == 0
     # Should still pass the env file to uv (POSIX format with escaped spaces)
     cmd = mock_subprocess.call_args[0][0]
-    expected_path = env_file.as_posix().replace(" ", r"\ ")
+    expected_path = expected_env_file_arg(env_file)
     assert expected_path in cmd
 
 
-def test_main_with_comments_only(tmp_path, mock_subprocess, mock_is_uv_available):
+def test_main_with_comments_only(tmp_path, mock_subprocess, monkeypatch):
     """Works with .env.uve containing only comments."""
     env_file = tmp_path / ".env.uve"
     env_file.write_text("# This is a comment\n# Another comment\n")
 
-    with (
-        patch("prime_uve.uve.wrapper.find_env_file_strict", return_value=env_file),
-        patch("sys.argv", ["uve", "sync"]),
-        pytest.raises(SystemExit) as exc_info,
-    ):
-        main()
+    with patch("prime_uve.uve.wrapper.find_env_file_strict", return_value=env_file):
+        exit_code = run_uve(monkeypatch, "sync")
 
-    assert exc_info.value.code == 0
+    assert exit_code == 0
 
 
-def test_main_full_workflow(mock_find_env_file, mock_subprocess, mock_is_uv_available):
+def test_main_full_workflow(
+    mock_find_env_file, mock_subprocess, clean_env, monkeypatch
+):
     """Full workflow: find env file, set HOME, run uv."""
-    with (
-        patch("sys.platform", "win32"),
-        patch.dict(os.environ, {"USERPROFILE": "C:\\Users\\test"}, clear=True),
-        patch("sys.argv", ["uve", "add", "requests"]),
-        pytest.raises(SystemExit) as exc_info,
-    ):
-        main()
+    monkeypatch.setattr(sys, "platform", "win32")
+    monkeypatch.setenv("USERPROFILE", "C:\\Users\\test")
 
-    assert exc_info.value.code == 0
+    exit_code = run_uve(monkeypatch, "add", "requests")
+
+    assert exit_code == 0
 
     # Verify command construction
     cmd = mock_subprocess.call_args[0][0]
-    assert cmd[0] == "uv"
-    assert cmd[1] == "run"
-    assert "--env-file" in cmd
-    assert "--" in cmd
-    assert "add" in cmd
-    assert "requests" in cmd
+    assert cmd[:2] == ["uv", "run"]
+    assert {"--env-file", "--", "add", "requests"}.issubset(cmd)
 
     # Verify HOME was set
     env = mock_subprocess.call_args[1]["env"]
     assert env["HOME"] == "C:\\Users\\test"
 
 
-def test_main_does_not_expand_env_file_vars(
-    tmp_path, mock_subprocess, mock_is_uv_available
-):
+def test_main_does_not_expand_env_file_vars(tmp_path, mock_subprocess, monkeypatch):
     """Variables in .env.uve are NOT expanded by uve (left to uv)."""
     env_file = tmp_path / ".env.uve"
     # Write file with ${HOME} variable
@@ -419,21 +317,17 @@ def test_main_does_not_expand_env_file_vars(
         "UV_PROJECT_ENVIRONMENT=${HOME}/prime-uve/venvs/test_12345678\n"
     )
 
-    with (
-        patch("prime_uve.uve.wrapper.find_env_file_strict", return_value=env_file),
-        patch("sys.argv", ["uve", "sync"]),
-        pytest.raises(SystemExit),
-    ):
-        main()
+    with patch("prime_uve.uve.wrapper.find_env_file_strict", return_value=env_file):
+        run_uve(monkeypatch, "sync")
 
     # uve just passes the path to the file (POSIX format), doesn't read or expand it
     cmd = mock_subprocess.call_args[0][0]
-    expected_path = env_file.as_posix().replace(" ", r"\ ")
+    expected_path = expected_env_file_arg(env_file)
     assert expected_path in cmd
     # The file content is NOT parsed or expanded by uve
 
 
-def test_main_with_spaces_in_path(tmp_path, mock_subprocess, mock_is_uv_available):
+def test_main_with_spaces_in_path(tmp_path, mock_subprocess, monkeypatch):
     """Handles .env.uve paths with spaces correctly on all platforms."""
     # Create path with spaces
     space_dir = tmp_path / "My Documents" / "Projects"
@@ -441,18 +335,14 @@ def test_main_with_spaces_in_path(tmp_path, mock_subprocess, mock_is_uv_availabl
     env_file = space_dir / ".env.uve"
     env_file.write_text("UV_PROJECT_ENVIRONMENT=${HOME}/venvs/test\n")
 
-    with (
-        patch("prime_uve.uve.wrapper.find_env_file_strict", return_value=env_file),
-        patch("sys.argv", ["uve", "sync"]),
-        pytest.raises(SystemExit) as exc_info,
-    ):
-        main()
+    with patch("prime_uve.uve.wrapper.find_env_file_strict", return_value=env_file):
+        exit_code = run_uve(monkeypatch, "sync")
 
     # Verify command was constructed with POSIX format and escaped spaces
     cmd = mock_subprocess.call_args[0][0]
-    expected_path = env_file.as_posix().replace(" ", r"\ ")
+    expected_path = expected_env_file_arg(env_file)
     assert expected_path in cmd
-    assert exc_info.value.code == 0
+    assert exit_code == 0
 
     # Verify spaces are escaped with backslashes
     env_file_arg = cmd[cmd.index("--env-file") + 1]